@@ -34,16 +34,25 @@ Collection of serial interfaces to OLED devices.
 # As before, as soon as the with block completes, the canvas buffer is flushed
 # to the device.
 
+from collections import OrderedDict
 from time import sleep
+from PIL import ImageChops
 from luma.core.device import device, parallel_device
 from luma.core.virtual import character
 from luma.oled.device.color import color_device
 from luma.oled.device.greyscale import greyscale_device
 import luma.core.error
 from luma.core.framebuffer import full_frame
-from luma.core.bitmap_font import embedded_fonts
+from luma.core.bitmap_font import embedded_fonts, load_sprite_table
 import luma.oled.const
 from luma.oled.device.framebuffer_mixin import __framebuffer_mixin
+from luma.oled.device.data_mixin import __data_mixin
+from luma.oled.device.rotation_mixin import __rotation_mixin
+from luma.oled.device.attach_mixin import __attach_mixin
+from luma.oled.device.scroll_buffer_mixin import __scroll_buffer_mixin
+from luma.oled.device.damage import copy_plan, damage_plan
+from luma.oled.device.encoder import pack_pages, pack_nibbles, pack_doubled_nibbles, \
+    changed_spans, changed_windows
 
 __all__ = [
     "ssd1305", "ssd1306", "ssd1309", "ssd1315", "ssd1316", "ssd1322",
@@ -52,7 +61,7 @@ __all__ = [
 ]
 
 
-class ch1115(device):
+class ch1115(device, __framebuffer_mixin, __data_mixin, __rotation_mixin, __attach_mixin):
     """
     Serial interface to a monochrome CH1115 OLED display (128x64).
 
@@ -68,16 +77,53 @@ class ch1115(device):
         with canvas(dev) as draw:
             draw.text((0, 0), "Hello CH1115", fill="white")
 
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, only the pages (and the run of columns within each
+        page) that differ from the last frame sent are transmitted.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+
     .. versionadded:: 3.15.0
     """
 
     def __init__(self, serial_interface=None, width=128, height=64,
-                 rotate=0, **kwargs):
+                 rotate=0, framebuffer=None, zero_copy=False, hardware_rotate=False,
+                 attach=False, initialize=True, frame_store=None, frame_key=None, **kwargs):
         # Re-use the SSD1306 command set – CH1115 is largely compatible
         super(ch1115, self).__init__(luma.oled.const.ssd1306, serial_interface)
         # 1-bit monochrome
         self.capabilities(width, height, rotate, mode="1")
+        self.init_framebuffer(framebuffer or full_frame())
+        self.init_data(zero_copy)
+        self.init_rotation(hardware_rotate)
+        self.init_attach(attach, initialize, frame_store, frame_key)
         self._pages = self._h // 8
+        self._last_buf = None
 
         if (width, height) != (128, 64):
             raise luma.core.error.DeviceDisplayModeError(
@@ -85,26 +131,27 @@ class ch1115(device):
 
         # Init sequence adapted from the working standalone CH1115 driver
         # (page addressing, internal DC-DC on).
-        self.command(
-            0xAE,        # display off
-            0xD5, 0x80,  # display clock divide / osc freq
-            0xA8, 0x3F,  # multiplex ratio (1/64)
-            0xD3, 0x00,  # display offset
-            0x40,        # start line = 0
-            0xAD, 0x8B,  # DC-DC control: internal DC-DC on (CH1115 specific)
-            0xA1,        # segment remap
-            0xC8,        # COM scan direction remapped
-            0xDA, 0x12,  # COM pins hardware configuration
-            0x81, 0x7F,  # contrast
-            0xD9, 0x22,  # pre-charge period
-            0xDB, 0x20,  # VCOMH deselect level
-            0xA4,        # entire display ON follows RAM
-            0xA6         # normal (non-inverted) display
-        )
-
-        self.clear()
-        self.show()
-        self.command(0xAF)  # display on
+        if self._initialize:
+            self.command(
+                0xAE,        # display off
+                0xD5, 0x80,  # display clock divide / osc freq
+                0xA8, 0x3F,  # multiplex ratio (1/64)
+                0xD3, 0x00,  # display offset
+                0x40,        # start line = 0
+                0xAD, 0x8B,  # DC-DC control: internal DC-DC on (CH1115 specific)
+                self.segment_remap(),       # segment remap
+                self.com_scan_direction(),  # COM scan direction
+                0xDA, 0x12,  # COM pins hardware configuration
+                0x81, 0x7F,  # contrast
+                0xD9, 0x22,  # pre-charge period
+                0xDB, 0x20,  # VCOMH deselect level
+                0xA4,        # entire display ON follows RAM
+                0xA6         # normal (non-inverted) display
+            )
+
+        self.startup()
+        if self._initialize:
+            self.command(0xAF)  # display on
 
     def display(self, image):
         """
@@ -114,42 +161,93 @@ class ch1115(device):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
-
-        set_page_address = 0xB0
-        image_data = image.getdata()
-        pixels_per_page = self.width * 8
-        buf = bytearray(self.width)
+        buf = pack_pages(self.prerotate(image), self._encode_rotate)
+        previous = None if isinstance(self.framebuffer, full_frame) else self._last_buf
 
-        for y in range(0, self._pages * pixels_per_page, pixels_per_page):
+        for page, start, end in changed_spans(previous, buf, self._w):
             # 0x02 column offset is what most 128x64-on-132x64 boards use
-            self.command(set_page_address, 0x02, 0x10)
-            set_page_address += 1
+            column = start + 0x02
+            self.command(0xB0 + page, column & 0x0F, 0x10 | column >> 4)
 
-            offsets = [y + self.width * i for i in range(8)]
-            for x in range(self.width):
-                val = 0
-                for i in range(8):
-                    if image_data[x + offsets[i]]:
-                        val |= (1 << i)
-                buf[x] = val
+            offset = page * self._w
+            self.data_buffer(buf[offset + start:offset + end])
 
-            self.data(buf)
+        self._last_buf = buf
+        self.save_frame(image)
 
 
-class sh1106(device):
+class sh1106(device, __framebuffer_mixin, __data_mixin, __rotation_mixin, __attach_mixin,
+             __scroll_buffer_mixin):
     """
     Serial interface to a monochrome SH1106 OLED display.
 
     On creation, an initialization sequence is pumped to the display
     to properly configure it. Further control commands can then be called to
     affect the brightness and other settings.
+
+    :param serial_interface: The serial interface (usually a
+        :py:class:`luma.core.interface.serial.i2c` instance) to delegate sending
+        data and commands through.
+    :param width: The number of horizontal pixels (optional, defaults to 128).
+    :type width: int
+    :param height: The number of vertical pixels (optional, defaults to 64).
+    :type height: int
+    :param rotate: An integer value of 0 (default), 1, 2 or 3 only, where 0 is
+        no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
+        represents 270° rotation.
+    :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, only the pages (and the run of columns within each
+        page) that differ from the last frame sent are transmitted.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
     """
 
-    def __init__(self, serial_interface=None, width=128, height=64, rotate=0, **kwargs):
+    def __init__(self, serial_interface=None, width=128, height=64, rotate=0,
+                 framebuffer=None, zero_copy=False, hardware_rotate=False,
+                 attach=False, initialize=True, frame_store=None, frame_key=None, scroll_buffer=False,
+                 **kwargs):
         super(sh1106, self).__init__(luma.oled.const.sh1106, serial_interface)
         self.capabilities(width, height, rotate)
+        self.init_framebuffer(framebuffer or full_frame())
+        self.init_data(zero_copy)
+        # The 128x32 and 128x128 panels are offset within the COM lines, so
+        # flipping the scan direction would move the image off the panel
+        self.init_rotation(hardware_rotate, mirrorable=(width, height) == (128, 64))
+        self.init_attach(attach, initialize, frame_store, frame_key)
+        self.init_scroll_buffer(scroll_buffer)
         self._pages = self._h // 8
+        self._last_buf = None
 
         settings = {
             (128, 128): dict(multiplex=0xFF, displayoffset=0x02),
@@ -161,25 +259,25 @@ class sh1106(device):
             raise luma.core.error.DeviceDisplayModeError(
                 f"Unsupported display mode: {width} x {height}")
 
-        self.command(
-            self._const.DISPLAYOFF,
-            self._const.MEMORYMODE,
-            self._const.SETHIGHCOLUMN,      0xB0, 0xC8,
-            self._const.SETLOWCOLUMN,       0x10, 0x40,
-            self._const.SETSEGMENTREMAP,
-            self._const.NORMALDISPLAY,
-            self._const.SETMULTIPLEX,       settings['multiplex'],
-            self._const.DISPLAYALLON_RESUME,
-            self._const.SETDISPLAYOFFSET,   settings['displayoffset'],
-            self._const.SETDISPLAYCLOCKDIV, 0xF0,
-            self._const.SETPRECHARGE,       0x22,
-            self._const.SETCOMPINS,         0x12,
-            self._const.SETVCOMDETECT,      0x20,
-            self._const.CHARGEPUMP,         0x14)
-
-        self.contrast(0x7F)
-        self.clear()
-        self.show()
+        if self._initialize:
+            self.command(
+                self._const.DISPLAYOFF,
+                self._const.MEMORYMODE,
+                self._const.SETHIGHCOLUMN,      0xB0, self.com_scan_direction(),
+                self._const.SETLOWCOLUMN,       0x10, 0x40,
+                self.segment_remap(),
+                self._const.NORMALDISPLAY,
+                self._const.SETMULTIPLEX,       settings['multiplex'],
+                self._const.DISPLAYALLON_RESUME,
+                self._const.SETDISPLAYOFFSET,   settings['displayoffset'],
+                self._const.SETDISPLAYCLOCKDIV, 0xF0,
+                self._const.SETPRECHARGE,       0x22,
+                self._const.SETCOMPINS,         0x12,
+                self._const.SETVCOMDETECT,      0x20,
+                self._const.CHARGEPUMP,         0x14)
+            self.contrast(0x7F)
+
+        self.startup()
 
     def display(self, image):
         """
@@ -192,33 +290,31 @@ class sh1106(device):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        buf = pack_pages(self.roll_frame(self.prerotate(image)), self._encode_rotate)
+        view = memoryview(buf)
+        previous = None if isinstance(self.framebuffer, full_frame) else self._last_buf
 
-        set_page_address = 0xB0
-        image_data = image.getdata()
-        pixels_per_page = self._w * 8
-        buf = bytearray(self._w)
+        for page, start, end in changed_spans(previous, buf, self._w):
+            # Page addressing only: select the page, then the start column
+            # (offset by 2, as the SH1106 GDDRAM is 132 columns wide)
+            column = start + 0x02
+            self.command(0xB0 + page, column & 0x0F, 0x10 | column >> 4)
 
-        for y in range(0, int(self._pages * pixels_per_page), pixels_per_page):
-            self.command(set_page_address, 0x02, 0x10)
-            set_page_address += 1
-            offsets = [y + self._w * i for i in range(8)]
+            offset = page * self._w
+            self.data_buffer(view[offset + start:offset + end])
 
-            for x in range(self._w):
-                buf[x] = \
-                    (image_data[x + offsets[0]] and 0x01) | \
-                    (image_data[x + offsets[1]] and 0x02) | \
-                    (image_data[x + offsets[2]] and 0x04) | \
-                    (image_data[x + offsets[3]] and 0x08) | \
-                    (image_data[x + offsets[4]] and 0x10) | \
-                    (image_data[x + offsets[5]] and 0x20) | \
-                    (image_data[x + offsets[6]] and 0x40) | \
-                    (image_data[x + offsets[7]] and 0x80)
+        self.update_start_line()
+        self._last_buf = buf
+        self.save_frame(image)
 
-            self.data(list(buf))
+    def _scroll_buffer_dimensions(self):
+        return [(128, 64)]
 
+    def _set_start_line(self, line):
+        self.command(self._const.SETSTARTLINE | line)
 
-class sh1107(device):
+
+class sh1107(device, __framebuffer_mixin, __data_mixin, __attach_mixin):
     """
     Serial interface to a monochrome SH1107 OLED display.
 
@@ -237,16 +333,50 @@ class sh1107(device):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, only the pages (and the run of columns within each
+        page) that differ from the last frame sent are transmitted.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
 
     .. versionadded:: 3.11.0
     """
 
-    def __init__(self, serial_interface=None, width=64, height=128, rotate=0, **kwargs):
+    _LOWEST_BIT = bytes(0xFF * (v & 1) for v in range(256))
+
+    def __init__(self, serial_interface=None, width=64, height=128, rotate=0,
+                 framebuffer=None, zero_copy=False, attach=False, initialize=True,
+                 frame_store=None, frame_key=None, **kwargs):
         super(sh1107, self).__init__(luma.oled.const.sh1107, serial_interface)
         self.capabilities(width, height, rotate)
+        self.init_framebuffer(framebuffer or full_frame())
+        self.init_data(zero_copy)
+        self.init_attach(attach, initialize, frame_store, frame_key)
 
         self._pages = self._h // 8
         self._pagelen = self._w
+        self._last_buf = None
 
         settings = {
             (64, 128): dict(multiplex=0x7F, displayoffset=0x60),
@@ -258,22 +388,22 @@ class sh1107(device):
             raise luma.core.error.DeviceDisplayModeError(
                 f"Unsupported display mode: {width} x {height}")
 
-        self.command(
-            self._const.DISPLAYOFF,
-            self._const.MEMORYMODE,
-            self._const.NORMALDISPLAY,
-            self._const.SETMULTIPLEX,       settings['multiplex'],
-            self._const.DISPLAYALLON_RESUME,
-            self._const.SETDISPLAYOFFSET,   settings['displayoffset'],
-            self._const.SETDISPLAYCLOCKDIV, 0x80,
-            self._const.SETPRECHARGE,       0x22,
-            self._const.SETCOMPINS,         0x12,
-            self._const.SETVCOMDETECT,      0x35,
-        )
-
-        self.contrast(0x7F)
-        self.clear()
-        self.show()
+        if self._initialize:
+            self.command(
+                self._const.DISPLAYOFF,
+                self._const.MEMORYMODE,
+                self._const.NORMALDISPLAY,
+                self._const.SETMULTIPLEX,       settings['multiplex'],
+                self._const.DISPLAYALLON_RESUME,
+                self._const.SETDISPLAYOFFSET,   settings['displayoffset'],
+                self._const.SETDISPLAYCLOCKDIV, 0x80,
+                self._const.SETPRECHARGE,       0x22,
+                self._const.SETCOMPINS,         0x12,
+                self._const.SETVCOMDETECT,      0x35,
+            )
+            self.contrast(0x7F)
+
+        self.startup()
 
     def display(self, image):
         """
@@ -286,21 +416,23 @@ class sh1107(device):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
-        pixmap = image.load()
-        buf = bytearray(self._pagelen)
+        # Pixels drawn in a colour other than white can hold values besides 0
+        # and 255; only those with the lowest bit set are lit on this display
+        buf = pack_pages(self.preprocess(image).point(self._LOWEST_BIT))
+        view = memoryview(buf)
+        previous = None if isinstance(self.framebuffer, full_frame) else self._last_buf
+
+        for page, start, end in changed_spans(previous, buf, self._pagelen):
+            offset = page * self._pagelen
+            self.command(0x10 | start >> 4, start & 0x0F, 0xb0 | page)
+            self.data_buffer(view[offset + start:offset + end])
 
-        for page in range(self._pages):
-            for x in range(self._pagelen):
-                tmp = 0
-                for y in range(8):
-                    tmp |= (pixmap[x, y + 8 * page] & 1) << y
-                buf[x] = tmp
-            self.command(0x10, 0x00, 0xb0 | page)
-            self.data(list(buf))
+        self._last_buf = buf
+        self.save_frame(image)
 
 
-class ssd1306(device):
+class ssd1306(device, __framebuffer_mixin, __data_mixin, __rotation_mixin, __attach_mixin,
+              __scroll_buffer_mixin):
     """
     Serial interface to a monochrome SSD1306 OLED display.
 
@@ -319,11 +451,69 @@ class ssd1306(device):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, the packed pages are compared with those last sent,
+        and each run of changed pages is sent as one window, covering the
+        changed columns in those pages.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
     """
 
-    def __init__(self, serial_interface=None, width=128, height=64, rotate=0, **kwargs):
+    # Scroll step intervals, by the number of frames between each step
+    _SCROLL_INTERVALS = {5: 0, 64: 1, 128: 2, 256: 3, 3: 4, 4: 5, 25: 6, 2: 7}
+
+    # Whether the controller's scroll commands are laid out as here
+    _SCROLL_SUPPORTED = True
+
+    # Trailing bytes of the horizontal scroll set up commands
+    _SCROLL_COLUMNS = (0x00, 0xFF)
+
+    # First byte of the diagonal scroll set up commands, and their trailing
+    # bytes after the vertical offset
+    _DIAGONAL_SCROLL_FLAG = 0x00
+    _DIAGONAL_SCROLL_COLUMNS = ()
+
+    def __init__(self, serial_interface=None, width=128, height=64, rotate=0,
+                 framebuffer=None, zero_copy=False, hardware_rotate=False,
+                 attach=False, initialize=True, frame_store=None, frame_key=None, scroll_buffer=False,
+                 **kwargs):
         super(ssd1306, self).__init__(luma.oled.const.ssd1306, serial_interface)
         self.capabilities(width, height, rotate)
+        self.init_framebuffer(framebuffer or full_frame())
+        self.init_data(zero_copy)
+        self.init_rotation(hardware_rotate)
+        self.init_attach(attach, initialize, frame_store, frame_key)
+        self.init_scroll_buffer(scroll_buffer)
 
         # Supported modes
         settings = {
@@ -339,35 +529,40 @@ class ssd1306(device):
                 f"Unsupported display mode: {width} x {height}")
 
         self._pages = height // 8
-        self._mask = [1 << (i // width) % 8 for i in range(width * height)]
-        self._offsets = [(width * (i // (width * 8))) + (i % width) for i in range(width * height)]
         self._colstart = settings['colstart']
-        self._colend = self._colstart + self._w
-
-        self.command(
-            self._const.DISPLAYOFF,
-            self._const.SETDISPLAYCLOCKDIV, settings['displayclockdiv'],
-            self._const.SETMULTIPLEX,       settings['multiplex'],
-            self._const.SETDISPLAYOFFSET,   0x00,
-            self._const.SETSTARTLINE,
-            self._const.CHARGEPUMP,         0x14,
-            self._const.MEMORYMODE,         0x00,
-            self._const.SETSEGMENTREMAP,
-            self._const.COMSCANDEC,
-            self._const.SETCOMPINS,         settings['compins'],
-            self._const.SETPRECHARGE,       0xF1,
-            self._const.SETVCOMDETECT,      0x40,
-            self._const.DISPLAYALLON_RESUME,
-            self._const.NORMALDISPLAY)
-
-        self.contrast(0xCF)
-        self.clear()
-        self.show()
+        self._last_buf = None
+        self._scrolling = False
+
+        if self._mirrored:
+            # Mirroring the 128-column GDDRAM moves the visible columns
+            self._colstart = 128 - width - self._colstart
+
+        if self._initialize:
+            self.command(
+                self._const.DISPLAYOFF,
+                self._const.SETDISPLAYCLOCKDIV, settings['displayclockdiv'],
+                self._const.SETMULTIPLEX,       settings['multiplex'],
+                self._const.SETDISPLAYOFFSET,   0x00,
+                self._const.SETSTARTLINE,
+                self._const.CHARGEPUMP,         0x14,
+                self._const.MEMORYMODE,         0x00,
+                self.segment_remap(),
+                self.com_scan_direction(),
+                self._const.SETCOMPINS,         settings['compins'],
+                self._const.SETPRECHARGE,       0xF1,
+                self._const.SETVCOMDETECT,      0x40,
+                self._const.DISPLAYALLON_RESUME,
+                self._const.NORMALDISPLAY)
+            self.contrast(0xCF)
+
+        self.startup()
 
     def display(self, image):
         """
         Takes a 1-bit :py:mod:`PIL.Image` and dumps it to the OLED
-        display.
+        display. Unless using a ``full_frame`` framebuffer, the packed pages
+        are compared with those last sent, and only the windows of pages and
+        columns that differ are sent.
 
         :param image: Image to display.
         :type image: :py:mod:`PIL.Image`
@@ -375,25 +570,135 @@ class ssd1306(device):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        if self._scrolling:
+            # Scrolling has moved display memory on since the last frame
+            self.command(self._const.DEACTIVATESCROLL)
+            self._scrolling = False
+            self._last_buf = None
 
+        buf = pack_pages(self.roll_frame(self.prerotate(image)), self._encode_rotate)
+        previous = None if isinstance(self.framebuffer, full_frame) else self._last_buf
+
+        for window in changed_windows(previous, buf, self._w):
+            self._write_window(buf, *window)
+
+        self.update_start_line()
+        self._last_buf = buf
+        self.save_frame(image)
+
+    def _scroll_buffer_dimensions(self):
+        return [(128, 64)]
+
+    def _set_start_line(self, line):
+        self.command(self._const.SETSTARTLINE | line)
+
+    def _write_window(self, buf, first, last, start, end):
+        """
+        Sends a window of pages and columns from a packed page buffer.
+        """
+        view = memoryview(buf)
         self.command(
             # Column start/end address
-            self._const.COLUMNADDR, self._colstart, self._colend - 1,
+            self._const.COLUMNADDR, self._colstart + start, self._colstart + end - 1,
             # Page start/end address
-            self._const.PAGEADDR, 0x00, self._pages - 1)
+            self._const.PAGEADDR, first, last - 1)
 
-        buf = bytearray(self._w * self._pages)
-        off = self._offsets
-        mask = self._mask
+        if start == 0 and end == self._w:
+            self.data_buffer(view[first * self._w:last * self._w])
+        else:
+            self.data_buffer(b"".join(
+                view[page * self._w + start:page * self._w + end]
+                for page in range(first, last)))
 
-        idx = 0
-        for pix in image.getdata():
-            if pix > 0:
-                buf[off[idx]] |= mask[idx]
-            idx += 1
+    def start_scroll(self, direction="left", start_page=0, end_page=None,
+                     frames=2, vertical_offset=0):
+        """
+        Starts the controller scrolling a range of pages continuously, with
+        nothing further sent over the bus until the scroll is stopped. Pages
+        and directions are in display memory terms, i.e. before any rotation.
+
+        The scrolled contents of display memory no longer match the last
+        frame displayed, so the next call to :func:`display` stops the scroll
+        and sends a full frame, as does :func:`stop_scroll` with the last
+        frame displayed.
+
+        :param direction: ``"left"`` or ``"right"``.
+        :type direction: str
+        :param start_page: The first page (8 rows) to scroll.
+        :type start_page: int
+        :param end_page: The last page to scroll, inclusive; defaults to the
+            bottom page.
+        :type end_page: int
+        :param frames: The number of frames between each one column step:
+            2, 3, 4, 5, 25, 64, 128 or 256.
+        :type frames: int
+        :param vertical_offset: If non-zero, scroll diagonally, moving this
+            many rows up within the vertical scroll area (see
+            :func:`set_vertical_scroll_area`) at each step as well.
+        :type vertical_offset: int
+
+        .. versionadded:: 3.16.0
+        """
+        self._check_scroll()
+        end_page = self._pages - 1 if end_page is None else end_page
+        assert direction in ("left", "right")
+        assert 0 <= start_page <= end_page < self._pages
+        assert frames in self._SCROLL_INTERVALS
+        assert 0 <= vertical_offset < self._h
+
+        # The scroll set up cannot be changed while scrolling
+        if self._scrolling:
+            self.command(self._const.DEACTIVATESCROLL)
+
+        interval = self._SCROLL_INTERVALS[frames]
+        if vertical_offset == 0:
+            cmd = self._const.LEFTHORIZONTALSCROLL if direction == "left" \
+                else self._const.RIGHTHORIZONTALSCROLL
+            self.command(cmd, 0x00, start_page, interval, end_page, *self._SCROLL_COLUMNS)
+        else:
+            cmd = self._const.VERTICALLEFTHORIZONTALSCROLL if direction == "left" \
+                else self._const.VERTICALRIGHTHORIZONTALSCROLL
+            self.command(cmd, self._DIAGONAL_SCROLL_FLAG, start_page, interval, end_page,
+                         vertical_offset, *self._DIAGONAL_SCROLL_COLUMNS)
+
+        self.command(self._const.ACTIVATESCROLL)
+        self._scrolling = True
+
+    def stop_scroll(self):
+        """
+        Stops the controller scrolling, and rewrites display memory with the
+        last frame displayed, as the controller requires.
 
-        self.data(list(buf))
+        .. versionadded:: 3.16.0
+        """
+        self._check_scroll()
+        self.command(self._const.DEACTIVATESCROLL)
+        if self._scrolling and self._last_buf is not None:
+            self._write_window(self._last_buf, 0, self._pages, 0, self._w)
+        self._scrolling = False
+
+    def set_vertical_scroll_area(self, fixed_rows, scroll_rows):
+        """
+        Sets the rows that move when scrolling diagonally: below the given
+        number of fixed rows at the top of the display, the given number of
+        rows scroll, with the rest fixed too.
+
+        :param fixed_rows: The number of rows fixed at the top.
+        :type fixed_rows: int
+        :param scroll_rows: The number of rows in the scroll area.
+        :type scroll_rows: int
+
+        .. versionadded:: 3.16.0
+        """
+        self._check_scroll()
+        assert fixed_rows >= 0 and scroll_rows >= 0
+        assert fixed_rows + scroll_rows <= self._h
+        self.command(self._const.SETVERTICALSCROLLAREA, fixed_rows, scroll_rows)
+
+    def _check_scroll(self):
+        if not self._SCROLL_SUPPORTED:
+            raise NotImplementedError(
+                f"Hardware scrolling is not supported on the {type(self).__name__}")
 
 
 class ssd1305(ssd1306):
@@ -419,13 +724,61 @@ class ssd1305(ssd1306):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, the packed pages are compared with those last sent,
+        and each run of changed pages is sent as one window, covering the
+        changed columns in those pages.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
 
     .. versionadded:: 3.15.0
     """
 
-    def __init__(self, serial_interface=None, width=128, height=32, rotate=0, **kwargs):
+    # The scroll commands are not laid out as on the SSD1306, so are not
+    # offered here
+    _SCROLL_SUPPORTED = False
+
+    def __init__(self, serial_interface=None, width=128, height=32, rotate=0,
+                 framebuffer=None, zero_copy=False, hardware_rotate=False,
+                 attach=False, initialize=True, frame_store=None, frame_key=None, scroll_buffer=False,
+                 **kwargs):
         super(ssd1306, self).__init__(luma.oled.const.ssd1306, serial_interface)
         self.capabilities(width, height, rotate)
+        self.init_framebuffer(framebuffer or full_frame())
+        self.init_data(zero_copy)
+        self.init_rotation(hardware_rotate)
+        self.init_attach(attach, initialize, frame_store, frame_key)
+        self.init_scroll_buffer(scroll_buffer)
 
         # Supported modes
         settings = {
@@ -438,30 +791,33 @@ class ssd1305(ssd1306):
                 f"Unsupported display mode: {width} x {height}")
 
         self._pages = height // 8
-        self._mask = [1 << (i // width) % 8 for i in range(width * height)]
-        self._offsets = [(width * (i // (width * 8))) + (i % width) for i in range(width * height)]
         self._colstart = settings['colstart']
-        self._colend = self._colstart + self._w
-
-        self.command(
-            self._const.DISPLAYOFF,
-            self._const.SETDISPLAYCLOCKDIV, settings['displayclockdiv'],
-            self._const.SETMULTIPLEX,       settings['multiplex'],
-            self._const.SETDISPLAYOFFSET,   0x00,
-            self._const.SETSTARTLINE,
-            self._const.CHARGEPUMP,         0x10,
-            self._const.MEMORYMODE,         0x00,
-            self._const.SETSEGMENTREMAP,
-            self._const.COMSCANDEC,
-            self._const.SETCOMPINS,         settings['compins'],
-            self._const.SETPRECHARGE,       0xF1,
-            self._const.SETVCOMDETECT,      0x40,
-            self._const.DISPLAYALLON_RESUME,
-            self._const.NORMALDISPLAY)
-
-        self.contrast(0xCF)
-        self.clear()
-        self.show()
+        self._last_buf = None
+        self._scrolling = False
+
+        if self._mirrored:
+            # Mirroring the 132-column GDDRAM moves the visible columns
+            self._colstart = 132 - width - self._colstart
+
+        if self._initialize:
+            self.command(
+                self._const.DISPLAYOFF,
+                self._const.SETDISPLAYCLOCKDIV, settings['displayclockdiv'],
+                self._const.SETMULTIPLEX,       settings['multiplex'],
+                self._const.SETDISPLAYOFFSET,   0x00,
+                self._const.SETSTARTLINE,
+                self._const.CHARGEPUMP,         0x10,
+                self._const.MEMORYMODE,         0x00,
+                self.segment_remap(),
+                self.com_scan_direction(),
+                self._const.SETCOMPINS,         settings['compins'],
+                self._const.SETPRECHARGE,       0xF1,
+                self._const.SETVCOMDETECT,      0x40,
+                self._const.DISPLAYALLON_RESUME,
+                self._const.NORMALDISPLAY)
+            self.contrast(0xCF)
+
+        self.startup()
 
 
 class ssd1309(ssd1306):
@@ -483,10 +839,53 @@ class ssd1309(ssd1306):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, the packed pages are compared with those last sent,
+        and each run of changed pages is sent as one window, covering the
+        changed columns in those pages.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
 
     .. versionadded:: 3.1.0
     """
 
+    # The SSD1309 takes the range of columns to scroll in place of the final
+    # dummy byte, and after the vertical offset when scrolling diagonally,
+    # where the first byte switches on horizontal movement
+    _SCROLL_COLUMNS = (0x00, 0x00, 0x7F)
+    _DIAGONAL_SCROLL_FLAG = 0x01
+    _DIAGONAL_SCROLL_COLUMNS = (0x00, 0x7F)
+
 
 class ssd1315(ssd1306):
     """
@@ -507,6 +906,42 @@ class ssd1315(ssd1306):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, the packed pages are compared with those last sent,
+        and each run of changed pages is sent as one window, covering the
+        changed columns in those pages.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
 
     .. versionadded:: 3.15.0
     """
@@ -531,9 +966,50 @@ class ssd1316(ssd1306):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
+    :param framebuffer: Framebuffering strategy, currently instances of
+        ``diff_to_previous`` or ``full_frame`` (default) are only supported.
+        When diffing, the packed pages are compared with those last sent,
+        and each run of changed pages is sent as one window, covering the
+        changed columns in those pages.
+    :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param hardware_rotate: If ``True``, rotate the display without a
+        separate pass over every frame: 180° is done by the controller
+        (where the panel geometry allows) and the rest while packing pages.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
 
     .. versionadded:: 3.15.0
     """
+
+    # The scroll commands are not laid out as on the SSD1306, so are not
+    # offered here
+    _SCROLL_SUPPORTED = False
+
     def __init__(self, serial_interface=None, width=128, height=32, rotate=0, **kwargs):
         super(ssd1316, self).__init__(serial_interface, width, height, rotate, **kwargs)
 
@@ -560,20 +1036,74 @@ class ssd1331(color_device):
     :param framebuffer: Framebuffering strategy, currently instances of
         ``diff_to_previous`` or ``full_frame`` are only supported.
     :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param batch: If ``True``, queue up the commands and data for each frame
+        and send them in as few serial transactions as possible.
+    :type batch: bool
+    :param hardware_rotate: If ``True``, rotate the display by remapping
+        its memory addresses rather than rotating every frame in software.
+        Supported for all rotations.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
+    :param motion_search: How many pixels in each direction to search for
+        content that has moved since the last frame (e.g. a sliding panel or
+        a moving sprite), to be moved with a hardware copy rather than sent
+        again. Only used with a ``diff_to_previous`` framebuffer, and without
+        hardware rotation or scroll buffering. 0 (default) turns this off.
+    :type motion_search: int
     """
 
     def __init__(self, serial_interface=None, width=96, height=64, rotate=0,
-                 framebuffer=None, **kwargs):
+                 framebuffer=None, motion_search=0, **kwargs):
+        # The hardware copy used for the last frame is kept in copy_plan
+        self._motion_search = motion_search
+        self.copy_plan = None
         super(ssd1331, self).__init__(serial_interface, width, height, rotate,
                                       framebuffer, **kwargs)
 
+    # Remap settings for each rotation: column address and COM scan
+    # direction flip the image horizontally and vertically, vertical address
+    # increment transposes it
+    _REMAP = (0x72, 0x71, 0x60, 0x63)
+
+    # Time for the display to finish each graphics acceleration command
+    # before it is sent anything else
+    _DRAW_DELAY = 0.003
+
     def _supported_dimensions(self):
         return [(96, 64)]
 
+    def _hardware_rotate_dimensions(self):
+        return [(96, 64)]
+
     def _init_sequence(self):
         self.command(
             0xAE,        # Display off
-            0xA0, 0x72,  # Seg remap
+            0xA0, self._REMAP[self._remap_rotate],  # Seg remap
             0xA1, 0x00,  # Set Display start line
             0xA2, 0x00,  # Set display offset
             0xA4,        # Normal display
@@ -589,6 +1119,12 @@ class ssd1331(color_device):
             0xBE, 0x3E,  # Set voltage
             0x87, 0x0F)  # Master current control
 
+    def _scroll_buffer_dimensions(self):
+        return [(96, 64)]
+
+    def _set_start_line(self, line):
+        self.command(0xA1, line)
+
     def _set_position(self, top, right, bottom, left):
         self.command(
             0x15, left, right - 1,    # Set column addr
@@ -609,6 +1145,182 @@ class ssd1331(color_device):
                      0x82, level,  # Set contrast B
                      0x83, level)  # Set contrast C
 
+    def _display_rgb565(self, encoded):
+        self.copy_plan = None
+        previous = getattr(self.framebuffer, "prev_image", None)
+        if self._motion_search and previous is not None and \
+                self._remap_rotate == 0 and not self._scroll_buffer:
+            self._copy_moved(previous, self._prerotate(encoded))
+
+        super(ssd1331, self)._display_rgb565(encoded)
+
+    def _copy_moved(self, previous, image):
+        # Block matching: try moving the area that changed by every offset
+        # within the search window, keeping the one that leaves the smallest
+        # area still to send
+        changed = ImageChops.difference(previous, image).getbbox()
+        if changed is None:
+            return
+
+        left, top, right, bottom = changed
+        target = image.crop(changed)
+        search = self._motion_search
+        best = None
+        for dy in range(-search, search + 1):
+            for dx in range(-search, search + 1):
+                # The part of the changed area that can be copied from display
+                # memory at this offset
+                dest = (max(left, dx), max(top, dy),
+                        min(right, self._w + dx), min(bottom, self._h + dy))
+                if (dx == 0 and dy == 0) or dest[0] >= dest[2] or dest[1] >= dest[3]:
+                    continue
+
+                moved = previous.crop(changed)
+                moved.paste(previous.crop((dest[0] - dx, dest[1] - dy, dest[2] - dx, dest[3] - dy)),
+                            (dest[0] - left, dest[1] - top))
+                residual = ImageChops.difference(moved, target).getbbox()
+                area = 0 if residual is None else \
+                    (residual[2] - residual[0]) * (residual[3] - residual[1])
+                if best is None or area < best[0]:
+                    best = (area, dx, dy, dest, residual)
+                    if area == 0:
+                        break
+            if best is not None and best[0] == 0:
+                break
+
+        if best is None:
+            return
+
+        # Only worth it if the copy commands and whatever is left to send cost
+        # less than sending the changed area
+        _, dx, dy, dest, residual = best
+        pieces = _copy_pieces(dest, dx, dy)
+        planner = self.damage_planner
+        copy_cost = len(pieces) * (7 + planner.setup_transactions * planner.transaction_bytes)
+        residual_cost = 0 if residual is None else planner.cost(residual)
+        saving = planner.cost(changed) - copy_cost - residual_cost
+        if saving <= 0:
+            return
+
+        # Carry on diffing from what display memory holds after the copies
+        shadow = previous.copy()
+        for left, top, right, bottom in pieces:
+            self.command(0x23, left - dx, top - dy, right - dx - 1, bottom - dy - 1,
+                         left, top)  # Copy window
+            sleep(self._DRAW_DELAY)
+            shadow.paste(shadow.crop((left - dx, top - dy, right - dx, bottom - dy)), (left, top))
+
+        self.framebuffer.prev_image = shadow
+        source = (dest[0] - dx, dest[1] - dy, dest[2] - dx, dest[3] - dy)
+        self.copy_plan = copy_plan(source, dest, saving)
+
+    def display_accelerated(self, image, primitives):
+        """
+        Renders an image drawn with an
+        :py:class:`luma.oled.device.hardware_draw.accelerated_canvas`. The
+        rectangles, lines and cleared areas recorded while drawing it are
+        drawn by the display itself, with its graphics acceleration commands,
+        and then only the pixels that still differ from the image are sent.
+
+        The commands are only used when the framebuffer knows what the
+        display is showing (i.e. ``diff_to_previous``, after the first frame)
+        and the image is not rotated or scrolled; otherwise the image is
+        simply displayed. Any primitive that would not change what the
+        display shows is skipped.
+
+        :param image: The image to render.
+        :type image: PIL.Image.Image
+        :param primitives: The primitives recorded while drawing the image,
+            as ``("rectangle", box, outline, fill)``, ``("line", box, color)``
+            or ``("clear", box)``, where ``box`` includes its right and bottom
+            edges, and colours are RGB tuples (``fill`` may be ``None``).
+        :type primitives: list
+
+        .. versionadded:: 3.16.0
+        """
+        assert image.mode == self.mode
+        assert image.size == self.size
+
+        # The framebuffer diffs the encoded image, so each primitive is drawn
+        # onto the previous frame in encoded colours, leaving the next diff to
+        # find whatever the commands did not draw
+        previous = getattr(self.framebuffer, "prev_image", None)
+        if previous is not None and self.rotate == 0 and not self._scroll_buffer:
+            shadow = previous.copy()
+            for primitive in primitives:
+                self._draw_primitive(shadow, *primitive)
+            self.framebuffer.prev_image = shadow
+
+        self.display(image)
+
+    def _draw_primitive(self, shadow, kind, box, *colors):
+        left, top, right, bottom = box
+        area = (left, top, right + 1, bottom + 1)
+        before = shadow.crop(area)
+
+        # Drawn onto the shadow exactly as the display draws them, rather
+        # than with ImageDraw, which can go outside the box
+        if kind == "clear":
+            shadow.paste((0, 0, 0), area)
+        elif kind == "line":
+            shadow.paste(_encode_color(colors[0]), area)
+        else:
+            outline, fill = colors
+            if fill is not None and right - left > 1 and bottom - top > 1:
+                shadow.paste(_encode_color(fill), (left + 1, top + 1, right, bottom))
+            for edge in ((left, top, right + 1, top + 1), (left, bottom, right + 1, bottom + 1),
+                         (left, top, left + 1, bottom + 1), (right, top, right + 1, bottom + 1)):
+                shadow.paste(_encode_color(outline), edge)
+
+        if ImageChops.difference(before, shadow.crop(area)).getbbox() is None:
+            return
+
+        if kind == "clear":
+            self.command(0x25, *box)                     # Clear window
+            sleep(self._DRAW_DELAY)
+        elif kind == "line":
+            self.command(0x21, *box, *_draw_color(colors[0]))  # Draw line
+            sleep(self._DRAW_DELAY)
+        else:
+            self.command(0x26, 0 if fill is None else 1)  # Fill enable
+            self.command(0x22, *box, *_draw_color(outline),
+                         *_draw_color(fill or (0, 0, 0)))  # Draw rectangle
+            sleep(self._DRAW_DELAY)
+
+
+def _copy_pieces(dest, dx, dy):
+    # The order the controller copies overlapping windows in is not known,
+    # so a copy whose source and destination overlap is split into strips
+    # along the direction it moves, each clear of its own source, starting
+    # from the far end so that no strip is copied from one already written
+    left, top, right, bottom = dest
+    if abs(dx) >= right - left or abs(dy) >= bottom - top:
+        return [dest]
+
+    if abs(dx) >= abs(dy):
+        step = abs(dx)
+        edges = range(right, left, -step) if dx > 0 else range(left, right, step)
+        return [(max(left, edge - step), top, edge, bottom) if dx > 0 else
+                (edge, top, min(right, edge + step), bottom) for edge in edges]
+
+    step = abs(dy)
+    edges = range(bottom, top, -step) if dy > 0 else range(top, bottom, step)
+    return [(left, max(top, edge - step), right, edge) if dy > 0 else
+            (left, edge, right, min(bottom, edge + step)) for edge in edges]
+
+
+def _encode_color(color):
+    # An RGB colour as drawn on an image returned by rgb565()
+    r, g, b = color
+    return (r & 0xF8 | g >> 5, g << 3 & 0xE0 | b >> 3, 0)
+
+
+def _draw_color(color):
+    # An RGB colour as the red, green and blue bytes of an SSD1331 graphics
+    # acceleration command (5, 6 and 5 bits, in the top of six bits)
+    r, g, b = color
+    return (r >> 3 << 1, g >> 2, b >> 3 << 1)
+
 
 class ssd1351(color_device):
     """
@@ -632,6 +1344,39 @@ class ssd1351(color_device):
     :param framebuffer: Framebuffering strategy, currently instances of
         ``diff_to_previous`` or ``full_frame`` are only supported.
     :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param batch: If ``True``, queue up the commands and data for each frame
+        and send them in as few serial transactions as possible.
+    :type batch: bool
+    :param hardware_rotate: If ``True``, rotate the display by remapping
+        its memory addresses rather than rotating every frame in software.
+        Only supported for 128x128 panels without offsets.
+    :type hardware_rotate: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
+    :param scroll_buffer: If ``True`` (and the display shows every row of
+        display memory, without hardware rotation), frames that move up, as
+        in a scrolling log, are shown by moving the display start line and
+        rewriting only the newly exposed rows.
+    :type scroll_buffer: bool
     :param bgr: Set to ``True`` if device pixels are BGR order (rather than RGB).
     :type bgr: bool
     :param h_offset: Horizontal offset (in pixels) of screen to device memory
@@ -644,6 +1389,9 @@ class ssd1351(color_device):
     .. versionadded:: 2.3.0
     """
 
+    # Column, row and write RAM commands, each sent as a command and data
+    _WINDOW_SETUP = (7, 5)
+
     def __init__(self, serial_interface=None, width=128, height=128, rotate=0,
                  framebuffer=None, h_offset=0, v_offset=0,
                  bgr=False, **kwargs):
@@ -651,17 +1399,41 @@ class ssd1351(color_device):
         # RGB or BGR order
         self._color_order = 0x04 if bgr else 0x00
 
+        self._offsets = (h_offset, v_offset)
         if h_offset != 0 or v_offset != 0:
             def offset(bbox):
                 left, top, right, bottom = bbox
                 return (left + h_offset, top + v_offset, right + h_offset, bottom + v_offset)
             self._apply_offsets = offset
 
+        # The rows being scrolled in hardware, if any, and the last frame
+        # displayed, to write them back with once the scroll is stopped
+        self._scroll_range = None
+        self._last_frame = None
+
         super(ssd1351, self).__init__(serial_interface, width, height, rotate, framebuffer, **kwargs)
 
+    # Remap settings for each rotation, as for the SSD1331
+    _REMAP = (0x70, 0x73, 0x62, 0x61)
+
+    # Time interval settings for each horizontal scroll speed
+    _SCROLL_SPEEDS = {"normal": 1, "slow": 2, "slowest": 3}
+
     def _supported_dimensions(self):
         return [(96, 96), (128, 128), (128, 96)]
 
+    def _hardware_rotate_dimensions(self):
+        # Remapping mirrors the whole 128x128 display memory, so the
+        # smaller (or offset) panels would no longer line up with it
+        return [(128, 128)] if self._offsets == (0, 0) else []
+
+    def _scroll_buffer_dimensions(self):
+        # Display memory is 128 rows, so the whole of it has to be on show
+        return [(128, 128)] if self._offsets == (0, 0) else []
+
+    def _set_start_line(self, line):
+        self.command(0xA1, line)
+
     def _init_sequence(self):
         self.command(0xFD, 0x12)               # Unlock IC MCU interface
         self.command(0xFD, 0xB1)               # Command A2,B1,B3,BB,BE,C1 accessible if in unlock state
@@ -670,7 +1442,7 @@ class ssd1351(color_device):
         self.command(0xCA, 0x7F)               # Mux ratio
         self.command(0x15, 0x00, self.width - 1)    # Set column address
         self.command(0x75, 0x00, self.height - 1)   # Set row address
-        self.command(0xA0, 0x70 | self._color_order)  # Segment remapping
+        self.command(0xA0, self._REMAP[self._remap_rotate] | self._color_order)  # Segment remapping
         self.command(0xA1, 0x00)               # Set Display start line
         self.command(0xA2, 0x00)               # Set display offset
         self.command(0xB5, 0x00)               # Set GPIO
@@ -700,6 +1472,92 @@ class ssd1351(color_device):
         assert 0 <= level <= 255
         self.command(0xC1, level, level, level)
 
+    def _display_rgb565(self, encoded):
+        self._last_frame = encoded
+        super(ssd1351, self)._display_rgb565(encoded)
+
+    def _plan_windows(self, bounding_boxes):
+        if self._scroll_range is None:
+            return super(ssd1351, self)._plan_windows(bounding_boxes)
+
+        # The rows being scrolled are left alone, planning the rows above and
+        # below them separately
+        top, bottom = self._scroll_range
+        windows, cost, unplanned_cost = [], 0, 0
+        for area in ((0, 0, self._w, top), (0, bottom, self._w, self._h)):
+            if area[1] < area[3]:
+                plan = self.damage_planner.plan(
+                    [box for box in (_intersect(bounding_box, area)
+                                     for bounding_box in bounding_boxes) if box], area)
+                windows += plan.windows
+                cost += plan.cost
+                unplanned_cost += plan.unplanned_cost
+
+        return damage_plan(windows, cost, unplanned_cost)
+
+    def start_scroll(self, direction="left", start_row=0, rows=None, offset=1,
+                     speed="normal"):
+        """
+        Starts the controller scrolling a range of rows horizontally and
+        continuously, with nothing further sent over the bus for those rows
+        until the scroll is stopped. While scrolling, :func:`display` only
+        sends changes to the rest of the display; the scrolled rows are
+        written with the last frame displayed once :func:`stop_scroll` is
+        called.
+
+        Not available with hardware rotation or a scroll buffer, and rows
+        are in display memory terms, i.e. before any software rotation.
+
+        :param direction: ``"left"`` or ``"right"``.
+        :type direction: str
+        :param start_row: The first row to scroll.
+        :type start_row: int
+        :param rows: The number of rows to scroll; defaults to the rest of
+            the display.
+        :type rows: int
+        :param offset: The number of columns moved at each step, 1-63.
+        :type offset: int
+        :param speed: ``"normal"``, ``"slow"`` or ``"slowest"``.
+        :type speed: str
+
+        .. versionadded:: 3.16.0
+        """
+        rows = self._h - start_row if rows is None else rows
+        assert not self._hardware_rotate and not self._scroll_buffer
+        assert direction in ("left", "right")
+        assert 0 <= start_row and 0 < rows and start_row + rows <= self._h
+        assert 1 <= offset <= 63
+        assert speed in self._SCROLL_SPEEDS
+
+        # The scroll set up cannot be changed while scrolling
+        if self._scroll_range is not None:
+            self.stop_scroll()
+
+        self.command(0x96,                       # Horizontal scroll
+                     offset if direction == "right" else 0x100 - offset,
+                     start_row + self._offsets[1], rows, 0x00,
+                     self._SCROLL_SPEEDS[speed])
+        self.command(0x9F)                       # Start moving
+        self._scroll_range = (start_row, start_row + rows)
+
+    def stop_scroll(self):
+        """
+        Stops the controller scrolling, and rewrites the scrolled rows with
+        the last frame displayed, as the controller requires.
+
+        .. versionadded:: 3.16.0
+        """
+        self.command(0x9E)                       # Stop moving
+        if self._scroll_range is None:
+            return
+
+        top, bottom = self._scroll_range
+        self._scroll_range = None
+        if self._last_frame is not None:
+            with self._batch:
+                self._write_window(self._prerotate(self._last_frame),
+                                   (0, top, self._w, bottom))
+
     def command(self, cmd, *args):
         """
         Sends a command and an (optional) sequence of arguments through to the
@@ -711,6 +1569,11 @@ class ssd1351(color_device):
             self._serial_interface.data(list(args))
 
 
+def _intersect(a, b):
+    box = (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+    return box if box[0] < box[2] and box[1] < box[3] else None
+
+
 class ssd1322(greyscale_device):
     """
     Serial interface to a 4-bit greyscale SSD1322 OLED display.
@@ -730,15 +1593,42 @@ class ssd1322(greyscale_device):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
-    :param mode: Supplying "1" or "RGB" effects a different rendering
+    :param mode: Supplying "1", "L" or "RGB" effects a different rendering
          mechanism, either to monochrome or 4-bit greyscale.
     :type mode: str
     :param framebuffer: Framebuffering strategy, currently instances of
         ``diff_to_previous`` or ``full_frame`` are only supported
     :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param batch: If ``True``, queue up the commands and data for each frame
+        and send them in as few serial transactions as possible.
+    :type batch: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
 
     """
 
+    # Column, row and write RAM commands, each sent as a command and data
+    _WINDOW_SETUP = (7, 5)
+
     def __init__(self, serial_interface=None, width=256, height=64, rotate=0,
                  mode="RGB", framebuffer=None, **kwargs):
         self._column_offset = (480 - width) // 2
@@ -812,12 +1702,36 @@ class ssd1362(greyscale_device):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
-    :param mode: Supplying "1" or "RGB" effects a different rendering
+    :param mode: Supplying "1", "L" or "RGB" effects a different rendering
          mechanism, either to monochrome or 4-bit greyscale.
     :type mode: str
     :param framebuffer: Framebuffering strategy, currently instances of
         ``diff_to_previous`` or ``full_frame`` are only supported
     :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param batch: If ``True``, queue up the commands and data for each frame
+        and send them in as few serial transactions as possible.
+    :type batch: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
 
     .. versionadded:: 3.4.0
     """
@@ -889,16 +1803,43 @@ class ssd1363(greyscale_device):
         no rotation, 1 is rotate 90° clockwise, 2 is 180° rotation and 3
         represents 270° rotation.
     :type rotate: int
-    :param mode: Supplying "1" or "RGB" effects a different rendering
+    :param mode: Supplying "1", "L" or "RGB" effects a different rendering
          mechanism, either to monochrome or 4-bit greyscale.
     :type mode: str
     :param framebuffer: Framebuffering strategy, currently instances of
         ``diff_to_previous`` or ``full_frame`` are only supported.
     :type framebuffer: str
+    :param zero_copy: If ``True``, pass encoded pixel buffers to the serial
+        interface as ``bytes``/``memoryview`` objects rather than lists.
+    :type zero_copy: bool
+    :param batch: If ``True``, queue up the commands and data for each frame
+        and send them in as few serial transactions as possible.
+    :type batch: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without clearing it, so
+        whatever it shows stays there until the first frame is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the initialization
+        sequence is skipped too, and the display is assumed to be set up
+        exactly as this driver would set it up.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
 
     .. versionadded:: 3.16.0
     """
 
+    # Column, row and write RAM commands, each sent as a command and data
+    _WINDOW_SETUP = (7, 5)
+
     def __init__(self, serial_interface=None, width=256, height=128,
                  rotate=0, mode="RGB", framebuffer=None, **kwargs):
         super(ssd1363, self).__init__(luma.oled.const.ssd1363, serial_interface,
@@ -942,9 +1883,9 @@ class ssd1363(greyscale_device):
 
     def display(self, image):
         """
-        Takes a 1-bit monochrome or 24-bit RGB image and renders it
-        to the greyscale OLED display. RGB pixels are converted to 4-bit
-        greyscale values using a simplified Luma calculation, based on
+        Takes a 1-bit monochrome, 8-bit greyscale or 24-bit RGB image and
+        renders it to the greyscale OLED display. RGB pixels are converted to
+        4-bit greyscale values using a simplified Luma calculation, based on
         *Y'=0.299R'+0.587G'+0.114B'*.
 
         Within each 2-byte column address the byte pair is swapped before
@@ -956,20 +1897,22 @@ class ssd1363(greyscale_device):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        rotated = self.preprocess(image)
+
+        self.damage_plan = self.damage_planner.plan(
+            [bounding_box for _, bounding_box in self.framebuffer.redraw(rotated)])
+
+        with self._batch:
+            for left, top, right, bottom in self.damage_plan.windows:
+                cropped = rotated.crop((left, top, right, bottom))
+                self._set_position(top, right, bottom, left)
+                buf = pack_nibbles(cropped, self._nibble_order)
+                # Within each 2-byte column address the byte pair must be swapped;
+                # the panel's column-remap wiring reverses the expected pair order.
+                buf[0::2], buf[1::2] = buf[1::2], buf[0::2]
+                self.data_buffer(buf)
 
-        for _, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = self._inflate_bbox(bounding_box)
-            cropped = image.crop((left, top, right, bottom))
-            width = right - left
-            height = bottom - top
-            buf = bytearray(width * height >> 1)
-            self._set_position(top, right, bottom, left)
-            self._populate(buf, cropped.getdata())
-            # Within each 2-byte column address the byte pair must be swapped;
-            # the panel's column-remap wiring reverses the expected pair order.
-            buf[0::2], buf[1::2] = buf[1::2], buf[0::2]
-            self.data(list(buf))
+        self.save_frame(image)
 
 
 class ssd1322_nhd(greyscale_device):
@@ -1020,30 +1963,11 @@ class ssd1322_nhd(greyscale_device):
         if len(args) > 0:
             self._serial_interface.data(list(args))
 
-    def _render_mono(self, buf, pixel_data):
-        i = 0
-        for pix in pixel_data:
-            if pix > 0:
-                buf[i] = 0xFF
-
-            i += 1
-
-    def _render_greyscale(self, buf, pixel_data):
-        i = 0
-        for r, g, b in pixel_data:
-            # RGB->Greyscale luma calculation into 4-bits
-            grey = (r * 306 + g * 601 + b * 117) >> 14
-
-            # NHD uses 2 SEG lines and one COM line per pixel
-            if grey > 0:
-                buf[i // 2] |= (grey << 4) | grey
-            i += 2
-
     def display(self, image):
         """
-        Takes a 1-bit monochrome or 24-bit RGB image and renders it
-        to the greyscale OLED display. RGB pixels are converted to 8-bit
-        greyscale values using a simplified Luma calculation, based on
+        Takes a 1-bit monochrome, 8-bit greyscale or 24-bit RGB image and
+        renders it to the greyscale OLED display. RGB pixels are converted to
+        8-bit greyscale values using a simplified Luma calculation, based on
         *Y'=0.299R'+0.587G'+0.114B'*.
 
         :param image: the image to render
@@ -1052,17 +1976,15 @@ class ssd1322_nhd(greyscale_device):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        with self._batch:
+            for segment, bounding_box in self.framebuffer.redraw(self.preprocess(image)):
+                _, top, _, bottom = bounding_box
 
-        for image, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = bounding_box
-            width = right - left
-            height = bottom - top
+                # NHD uses 2 SEG lines and one COM line per pixel
+                self._set_position(top, bottom)
+                self.data_buffer(pack_doubled_nibbles(segment))
 
-            buf = bytearray(width * height)
-            self._set_position(top, bottom)
-            self._populate(buf, image.getdata())
-            self.data(list(buf))
+        self.save_frame(image)
 
 
 class ssd1325(greyscale_device):
@@ -1156,13 +2078,19 @@ class ssd1327(greyscale_device):
             0xD5, 0x62,         # Enable 2nd pre-charge
             0xB6, 0x0F)         # 2nd Pre-charge period: 15 clks
 
+    def _scroll_buffer_dimensions(self):
+        return [(128, 128)]
+
+    def _set_start_line(self, line):
+        self.command(0xA1, line)
+
     def _set_position(self, top, right, bottom, left):
         self.command(
             0x15, left >> 1, (right - 1) >> 1,  # set column addr
             0x75, top, bottom - 1)  # set row addr
 
 
-class ws0010(parallel_device, character, __framebuffer_mixin):
+class ws0010(parallel_device, character, __framebuffer_mixin, __attach_mixin):
     """
     Serial interface to a monochrome Winstar WS0010 OLED display.  This
     interface will work with most ws0010 powered devices including the weg010016.
@@ -1193,6 +2121,28 @@ class ws0010(parallel_device, character, __framebuffer_mixin):
     :param framebuffer: Framebuffering strategy, currently values of
         ``diff_to_previous`` or ``full_frame`` are only supported.
     :type framebuffer: str
+    :param character_mode: If ``True``, text assigned to the 'text' instance
+        variable is sent as one character code per cell, with the display in
+        character mode, rather than as rendered bitmaps (see note).
+    :type character_mode: bool
+    :param attach: If ``True``, take over a display that is already running
+        (for example, after restarting the program) without waiting for it to
+        power up or blanking it, so whatever it shows stays there until the
+        first frame or text is displayed.
+    :type attach: bool
+    :param initialize: If ``False`` when attaching, the reset sequence is
+        skipped too.
+    :type initialize: bool
+    :param frame_store: A directory (for example ``/dev/shm``) in which to
+        keep a copy of the last frame displayed. When attaching, the copy
+        left there by the previous run is picked up as the starting point for
+        change tracking, so the first frame only sends what has changed.
+    :type frame_store: str
+    :param frame_key: A name to tell this display's frame apart from those
+        of other displays in the same frame store. By default, the name is
+        made from the serial interface: the I²C or SPI device it has open,
+        along with its address or GPIO pins.
+    :type frame_key: str
 
     To place text on the display, simply assign the text to the 'text'
     instance variable::
@@ -1215,6 +2165,14 @@ class ws0010(parallel_device, character, __framebuffer_mixin):
         any PIL.ImageFont object instead by providing it to the font parameter.
         If you do, the internal fonts will be bypassed.
 
+        With ``character_mode`` enabled, only the cells whose character has
+        changed are rewritten.  This needs one of the 5x8 internal fonts and
+        no rotation; any text that the display cannot show from its own font
+        table (for example, characters added with ``font.combine``) is drawn
+        in graphics mode instead, switching back once it can.  Custom glyphs
+        added with :func:`define_glyph` are shown from the display's eight
+        user-definable (CGRAM) characters.
+
         Available Internal Fonts
         +--------+---------+----------------------+------+
         | Number | Name    | Font                 | Size |
@@ -1241,14 +2199,33 @@ class ws0010(parallel_device, character, __framebuffer_mixin):
 
     def __init__(self, serial_interface=None, width=100, height=16, undefined='_', font=None,
                  selected_font=0, exec_time=1e-6 * 50, rotate=0, framebuffer=None,
-                 const=luma.oled.const.ws0010, **kwargs):
+                 const=luma.oled.const.ws0010, character_mode=False, attach=False,
+                 initialize=True, frame_store=None, frame_key=None, **kwargs):
         super(ws0010, self).__init__(const, serial_interface, exec_time=exec_time, **kwargs)
         self.capabilities(width, height, rotate)
         self.init_framebuffer(framebuffer)
+        self.init_attach(attach, initialize, frame_store, frame_key)
         self.font = font if font is not None else embedded_fonts(self._const.FONTDATA, selected_font=selected_font)
         self._undefined = undefined
         self.device = self
 
+        # Character mode needs one of the embedded 5x8 font tables (FT00 to
+        # FT11), which are selected by the low two bits of FUNCTIONSET
+        self._font_table = None
+        if character_mode and font is None and rotate == 0:
+            table = self.font.names_index.get(selected_font, selected_font)
+            if table in range(4):
+                self._font_table = table
+                self._cell_width = self._const.FONTDATA['metrics'][table]['xwidth']
+        self._cells = None
+        self._codes = (None, {})
+        self._graphic = True
+        self._glyphs = {}
+        self._cgram = OrderedDict()
+        self._resynced = False
+        # Whether the display is showing the text, rather than an image
+        self._showing_text = False
+
         # Supported modes
         supported = (width, height) in [(40, 8), (40, 16), (60, 8), (60, 16), (80, 8), (80, 16), (100, 8), (100, 16)]
         if not supported:
@@ -1257,9 +2234,20 @@ class ws0010(parallel_device, character, __framebuffer_mixin):
 
         # In case display just powered up, sleep to be sure it has finished
         # its internal initialization
-        sleep(0.5)
-        self._reset()
+        if not attach:
+            sleep(0.5)
+        if self._initialize:
+            self._reset()
+        else:
+            # Could be in either mode, so set it on the first frame or text
+            self._graphic = None
+
+        # When attaching, leave the display as it is until then too
+        self._attaching = attach
         self.text = ""
+        self._attaching = False
+        if attach:
+            self.restore_frame()
 
     def _reset(self):
         """
@@ -1286,6 +2274,77 @@ class ws0010(parallel_device, character, __framebuffer_mixin):
         self.command(self._const.ENTRY)  # Set entry mode to direction right, no shift
         self.command(self._const.POWERON | self._const.GRAPHIC)  # Turn internal power on and set into graphics mode
         self.command(self._const.DISPLAYON)  # Turn Display back on
+        self._graphic = True
+        self._cells = None
+        self._cgram.clear()
+        self._resynced = True
+
+    def _resync(self):
+        """
+        Re-establishes nibble alignment with the display in 4 bit mode,
+        without the rest of the :func:`_reset` sequence (which blanks the
+        display): five 0s put it back in step whatever nibble it was
+        expecting, and the interface data length is then set again.
+
+        This is done at most once per frame, and not at all straight after
+        a reset.
+        """
+        if self._bitmode == 4 and not self._resynced:
+            self.command(0x00, 0x00, 0x02, self._function_set())
+        self._resynced = False
+
+    def _function_set(self):
+        function_set = self._const.FUNCTIONSET | (0x10 if self._bitmode == 8 else 0x00)
+        if self._font_table is not None:
+            function_set = function_set & ~0x03 | self._font_table
+        return function_set
+
+    def _set_graphic(self, graphic):
+        """
+        Switches between graphics and character mode, returning ``True`` if
+        the mode changed.
+        """
+        if graphic == self._graphic:
+            return False
+
+        mode = self._const.GRAPHIC if graphic else self._const.CHAR
+        self.command(self._function_set(), self._const.POWERON | mode)
+        self._graphic = graphic
+        self._cells = None
+        self._cgram.clear()
+        return True
+
+    def _character_code(self, char):
+        """
+        Returns the code for a character in the display's own font table, or
+        ``None`` if it is not there or is drawn differently by the current
+        font (e.g. after ``font.combine``).
+        """
+        font = self.font.current
+        if self._codes[0] is not font:
+            self._codes = (font, {})
+        codes = self._codes[1]
+
+        if char not in codes:
+            table = self.font.load(self._font_table)
+            pua = table.PUA_SPACE
+
+            def lookup(f):
+                idx = f.mappings.get(ord(char))
+                return f.mappings.get(ord(char) + pua) if idx is None else idx
+
+            idx, table_idx = lookup(font), lookup(table)
+            if idx is None or table_idx is None:
+                codes[char] = None
+            elif font is not table and \
+                    (font.metrics[idx]['img'].tobytes(), font.metrics[idx]['dst']) != \
+                    (table.metrics[table_idx]['img'].tobytes(), table.metrics[table_idx]['dst']):
+                codes[char] = None
+            else:
+                codes[char] = next(k - pua for k, v in table.mappings.items()
+                                   if k >= pua and v == table_idx)
+
+        return codes[char]
 
     def display(self, image):
         """
@@ -1295,36 +2354,176 @@ class ws0010(parallel_device, character, __framebuffer_mixin):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        self._showing_text = False
+        frame, image = image, self.preprocess(image)
 
-        for _, bounding_box in self.framebuffer.redraw(image):
+        # Nothing can be assumed about the graphics on the display after
+        # character mode, so redraw the whole frame on switching back
+        bounding_boxes = [bounding_box for _, bounding_box in self.framebuffer.redraw(image)]
+        if bounding_boxes or not self._graphic:
+            self._resync()
+        if self._set_graphic(True):
+            bounding_boxes = [(0, 0) + image.size]
+
+        for bounding_box in bounding_boxes:
             # Expand bounding box to align to cell height boundary (8)
             # TODO: Should consider whether this should be moved into framebuffer class
             left, top, right, bottom = bounding_box
             top = top // 8 * 8
             bottom = bottom // 8 * 8 if not bottom % 8 else (bottom // 8 + 1) * 8
 
-            if self._bitmode == 4:
-                # If in 4 bit mode, issue reset to make sure we are in sync with the display
-                self._reset()
-
-            w = right - left
-            h = bottom - top
-            mask = [1 << (i // w) % 8 for i in range(w * h)]
-            off = [(w * (i // (w * 8))) + (i % w) for i in range(w * h)]
-            buf = bytearray(w * h // 8)
-
-            image_segment = image.crop((left, top, right, bottom))
-            for idx, pix in enumerate(image_segment.getdata()):
-                if pix > 0:
-                    buf[off[idx]] |= mask[idx]
+            buf = pack_pages(image.crop((left, top, right, bottom)))
 
-            lines = int((bottom - top) / 8)
-            lineSize = int(len(buf) / lines)
+            lines = (bottom - top) // 8
+            lineSize = right - left
             for i in range(lines):
                 self.command(self._const.DDRAMADDR + left, self._const.CGRAMADDR + i + (top // 8))  # Set display to current line at the starting column to update
                 self.data(buf[lineSize * i:lineSize * (i + 1)])   # Send section of current line that needs to be changed
 
+        self.save_frame(frame)
+
+    def _flush(self, buf):
+        if self._attaching:
+            return
+        cells = self._character_cells(buf) if self._font_table is not None else None
+        if cells is None:
+            super(ws0010, self)._flush(buf)
+        else:
+            # Only images are kept in the frame store, so the frame there
+            # is no longer on show
+            self._display_cells(cells)
+            self.forget_frame()
+        self._showing_text = True
+
+    def _character_cells(self, text):
+        """
+        Lays the text out as a list of character codes for each line of the
+        display, or returns ``None`` if it cannot be shown in character mode.
+        """
+        columns = self._w // self._cell_width
+        rows = self._h // 8
+        lines = ''.join(text).split('\n')[:rows]
+
+        cells = []
+        for line in lines + [''] * (rows - len(lines)):
+            if len(line) > columns and self._w % self._cell_width:
+                # The next character would be partly visible
+                return None
+
+            codes = []
+            for char in line[:columns].ljust(columns):
+                if char in self._glyphs:
+                    # Custom glyphs are given a CGRAM code once displayed
+                    codes.append(char)
+                    continue
+                if self.font.getlength(char) == 0:
+                    char = self._undefined
+                code = self._character_code(char)
+                if code is None:
+                    return None
+                codes.append(code)
+            cells.append(codes)
+
+        glyphs = set(code for codes in cells for code in codes if code in self._glyphs)
+        if len(glyphs) > 8:
+            return None
+
+        return cells
+
+    def _load_glyphs(self, cells):
+        """
+        Makes sure every custom glyph in the cells is loaded into a CGRAM
+        slot, evicting the least recently used glyphs that are not needed,
+        and returns the cells with each glyph replaced by its slot number.
+        """
+        glyphs = list(dict.fromkeys(code for codes in cells for code in codes
+                                    if isinstance(code, str)))
+        for char in glyphs:
+            if char in self._cgram:
+                self._cgram.move_to_end(char)
+                continue
+
+            free = set(range(8)) - set(self._cgram.values())
+            if free:
+                slot = min(free)
+            else:
+                evict = next(c for c in self._cgram if c not in glyphs)
+                slot = self._cgram.pop(evict)
+
+            self._cgram[char] = slot
+            self.command(self._const.CGRAMADDR | slot << 3)
+            self.data(self._glyphs[char])
+
+        return [[self._cgram[code] if isinstance(code, str) else code for code in codes]
+                for codes in cells]
+
+    def define_glyph(self, char, image):
+        """
+        Adds (or replaces) a custom glyph, which can then be used in the
+        'text' instance variable like any other character.  The glyph is
+        added to the current font, and, in character mode, is uploaded to
+        one of the display's eight CGRAM characters when first shown.  Only
+        the least recently used glyphs are evicted when more than eight are
+        defined, and changing a glyph that is on show just re-uploads it.
+
+        :param char: The character to show the glyph for, typically from the
+            Unicode private use area (e.g. ``'\ue000'``).
+        :type char: str
+        :param image: A 5x8 pixel image of the glyph.
+        :type image: PIL.Image.Image
+
+        .. versionadded:: 3.16.0
+        """
+        assert image.size == (5, 8)
+        image = image.convert("1")
+
+        # One byte per row, with the leftmost pixel in bit 4
+        self._glyphs[char] = bytes(row >> 3 for row in image.tobytes())
+        if char in self._cgram:
+            # Already on show in character mode, so update it in place
+            self.command(self._const.CGRAMADDR | self._cgram[char] << 3)
+            self.data(self._glyphs[char])
+
+        xwidth = self._const.FONTDATA['metrics'][0]['xwidth']
+        glyph = load_sprite_table(image, [ord(char)], xwidth, (5, 8), (5, 8), {ord(char): ord(char)})
+        self.font.combine(glyph, char, force=True)
+
+        # Redraw the text with the glyph, unless an image is on show instead
+        if self._showing_text:
+            self._flush(self._text_buffer)
+
+    def _display_cells(self, cells):
+        """
+        Writes the character codes to DDRAM, skipping any cells that already
+        hold the same code.
+        """
+        # Glyphs are compared by the CGRAM slot they are shown from; one that
+        # is not loaded yet has no slot, and so counts as a change
+        slots = [[self._cgram.get(code) if isinstance(code, str) else code for code in codes]
+                 for codes in cells]
+        if self._graphic or slots != self._cells:
+            self._resync()
+        self._set_graphic(False)
+        cells = self._load_glyphs(cells)
+        previous = self._cells or [[None] * len(codes) for codes in cells]
+
+        for line, codes in enumerate(cells):
+            start = 0
+            while start < len(codes):
+                if codes[start] == previous[line][start]:
+                    start += 1
+                    continue
+
+                end = start + 1
+                while end < len(codes) and codes[end] != previous[line][end]:
+                    end += 1
+
+                self.command(self._const.DDRAMADDR | (0x40 * line + start))
+                self.data(bytes(codes[start:end]))
+                start = end
+
+        self._cells = cells
+
     def get_font(self, ft):
         """
         Load one of the devices embedded fonts by its index value or name and
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+import os
+
+from PIL import Image
+
+from luma.core.interface.serial import i2c, noop, spi
+
+
+class __attach_mixin(object):
+    """
+    Helper class for taking over a display that is already initialized and
+    showing content, rather than starting it from scratch, optionally picking
+    up the last frame that was displayed from a frame store.
+
+    .. versionadded:: 3.16.0
+    """
+    def init_attach(self, attach, initialize, frame_store=None, frame_key=None):
+        """
+        Must be called after the device capabilities and serial interface
+        have been set.
+
+        :param attach: If ``True``, the display is not cleared on creation.
+        :type attach: bool
+        :param initialize: If ``False`` when attaching, the initialization
+            sequence is skipped too. Always ``True`` when not attaching.
+        :type initialize: bool
+        :param frame_store: A directory in which to keep the last frame
+            displayed, or ``None``.
+        :type frame_store: str
+        :param frame_key: A name for this display's frames, in place of one
+            made from the serial interface, or ``None``.
+        :type frame_key: str
+        """
+        self._attach = attach
+        self._initialize = initialize or not attach
+        self._frame_file = None
+        if frame_store is not None:
+            self._frame_file = os.path.join(
+                frame_store, _frame_name(self, self._serial_interface, frame_key))
+
+    def startup(self):
+        """
+        Clears the display and switches it on, as the last step of creating
+        the device. When attaching, whatever the display shows is left alone
+        until the first frame, and it is only switched on again if the
+        initialization sequence (which usually switches it off) was sent.
+        """
+        if not self._attach:
+            self.clear()
+        else:
+            self.restore_frame()
+        if self._initialize:
+            self.show()
+
+    def save_frame(self, image):
+        """
+        Writes the frame just displayed to the frame store, if there is one.
+        The file is replaced in one go, so it never holds a partial frame.
+        """
+        if self._frame_file is None:
+            return
+
+        temp_file = self._frame_file + ".tmp"
+        with open(temp_file, "wb") as fp:
+            fp.write(self._frame_bytes(image))
+        os.replace(temp_file, self._frame_file)
+
+    def forget_frame(self):
+        """
+        Removes the last frame displayed from the frame store, if there is
+        one, for when the display goes on to show something that is not kept
+        there (such as text in character mode). Attaching afterwards then
+        starts afresh, rather than from a frame the display no longer shows.
+        """
+        if self._frame_file is None:
+            return
+
+        try:
+            os.remove(self._frame_file)
+        except OSError:
+            pass
+
+    def restore_frame(self):
+        """
+        Reads the last frame displayed back from the frame store, if there is
+        one, and replays it through the driver without sending anything to
+        the display. Any change tracking then carries on from the frame that
+        the display is already showing, so the next frame only sends what
+        differs from it.
+        """
+        # With a scroll buffer, display memory holds the frame rolled around
+        # a start line that is not known, so nothing can be carried over
+        if self._frame_file is None or getattr(self, "_scroll_buffer", False):
+            return
+
+        try:
+            with open(self._frame_file, "rb") as fp:
+                data = fp.read()
+        except OSError:
+            return
+
+        serial_interface, self._serial_interface = self._serial_interface, noop()
+        try:
+            self._replay_frame(data)
+        finally:
+            self._serial_interface = serial_interface
+
+    def _frame_bytes(self, image):
+        return image.tobytes()
+
+    def _replay_frame(self, data):
+        # Frames saved by a differently configured device are ignored
+        if len(data) == len(Image.new(self.mode, self.size).tobytes()):
+            self.display(Image.frombytes(self.mode, self.size, data))
+
+
+def _frame_name(device, serial_interface, frame_key=None):
+    # The device class, geometry and rotation, then either the given key or
+    # the interface class along with the bus device it has open and whichever
+    # address or pins it was set up with
+    parts = [type(device).__name__, f"{device.width}x{device.height}",
+             f"rotate{device.rotate}"]
+    if frame_key is not None:
+        return "_".join(parts + [str(frame_key)]) + ".frame"
+
+    parts.append(type(serial_interface).__name__)
+    bus = _bus_device(serial_interface)
+    if bus is not None:
+        parts.append(bus)
+    for attr in ("_addr", "_CE", "_DC", "_RST", "_RS", "_E", "_PINS"):
+        value = getattr(serial_interface, attr, None)
+        if isinstance(value, int):
+            parts.append(f"{attr[1:]}{value}")
+        elif isinstance(value, (list, tuple)) and all(isinstance(v, int) for v in value):
+            parts.append(attr[1:] + "-".join(str(v) for v in value))
+    return "_".join(parts) + ".frame"
+
+
+def _bus_device(serial_interface):
+    # The name of the I²C bus or SPI device node that the interface has open
+    # (e.g. i2c-1 or spidev0.1), as the interfaces do not keep the port and
+    # device numbers they were given
+    try:
+        if isinstance(serial_interface, i2c):
+            fd = serial_interface._bus.fd
+        elif isinstance(serial_interface, spi):
+            fd = serial_interface._spi.fileno()
+        else:
+            return None
+    except Exception:
+        return None
+    if not isinstance(fd, int):
+        return None
+
+    try:
+        return os.path.basename(os.readlink(f"/proc/self/fd/{fd}"))
+    except OSError:
+        return None
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Command batching for serial interfaces.
+
+.. versionadded:: 3.16.0
+"""
+
+from itertools import chain
+
+# Largest run of command bytes that every serial interface will accept in one
+# transaction (the I²C interface asserts on anything bigger).
+MAX_COMMAND_BYTES = 32
+
+
+class serial_batch(object):
+    """
+    Wraps a serial interface so that, while inside a ``with`` block, command
+    and data bytes are queued up rather than sent straight away. Consecutive
+    writes at the same DC level are merged, and the queue is flushed in as
+    few ``command()``/``data()`` transactions as possible when the outermost
+    ``with`` block exits. The DC-framed byte stream that reaches the device is
+    identical to sending each write individually.
+
+    Outside of a ``with`` block, writes are passed straight through.
+
+    :param serial_interface: The serial interface to delegate to.
+    """
+
+    def __init__(self, serial_interface):
+        self._serial_interface = serial_interface
+        self._segments = []
+        self._depth = 0
+
+    def __getattr__(self, attr):
+        return getattr(self._serial_interface, attr)
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            self.flush()
+
+    def command(self, *cmd):
+        """
+        Queues a command or sequence of commands.
+        """
+        if self._depth == 0:
+            self._serial_interface.command(*cmd)
+        else:
+            self._queue(True, cmd)
+
+    def data(self, data):
+        """
+        Queues a data byte or sequence of data bytes.
+        """
+        if self._depth == 0:
+            self._serial_interface.data(data)
+        else:
+            self._queue(False, data)
+
+    def _queue(self, is_command, chunk):
+        if self._segments:
+            last_is_command, chunks, size = self._segments[-1]
+            if last_is_command == is_command and \
+                    (not is_command or size + len(chunk) <= MAX_COMMAND_BYTES):
+                chunks.append(chunk)
+                self._segments[-1][2] += len(chunk)
+                return
+
+        self._segments.append([is_command, [chunk], len(chunk)])
+
+    def flush(self):
+        """
+        Sends any queued commands and data through to the serial interface.
+        """
+        segments, self._segments = self._segments, []
+        for is_command, chunks, _ in segments:
+            if is_command:
+                self._serial_interface.command(*chain(*chunks))
+            elif len(chunks) == 1:
+                self._serial_interface.data(chunks[0])
+            else:
+                self._serial_interface.data(list(chain(*chunks)))
+
+    def cleanup(self):
+        """
+        Flushes anything still queued, then cleans up the serial interface.
+        """
+        self.flush()
+        self._serial_interface.cleanup()
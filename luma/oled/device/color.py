@@ -9,30 +9,68 @@ Base class for SSD13xx color devices
 """
 
 from abc import abstractmethod, ABCMeta
+from contextlib import nullcontext
 
 from luma.core.device import device
 import luma.core.error
 import luma.core.framebuffer
 import luma.oled.const
 from luma.oled.device.framebuffer_mixin import __framebuffer_mixin
+from luma.oled.device.data_mixin import __data_mixin
+from luma.oled.device.attach_mixin import __attach_mixin
+from luma.oled.device.scroll_buffer_mixin import __scroll_buffer_mixin
+from luma.oled.device.batch import serial_batch
+from luma.oled.device.encoder import rgb565, rgb565_frombytes, pack_rgb565
+from luma.oled.device.damage import damage_planner
 
 
-class color_device(device, __framebuffer_mixin):
+class color_device(device, __framebuffer_mixin, __data_mixin, __attach_mixin,
+                   __scroll_buffer_mixin):
     __metaclass__ = ABCMeta
 
-    def __init__(self, serial_interface, width, height, rotate, framebuffer, **kwargs):
+    # The command bytes sent by _set_position, and the number of command()
+    # and data() calls that they are sent in
+    _WINDOW_SETUP = (6, 1)
+
+    def __init__(self, serial_interface, width, height, rotate, framebuffer,
+                 zero_copy=False, batch=False, hardware_rotate=False, attach=False,
+                 initialize=True, frame_store=None, frame_key=None, scroll_buffer=False, **kwargs):
         super(color_device, self).__init__(luma.oled.const.common, serial_interface)
         self.capabilities(width, height, rotate, mode="RGB")
         self.init_framebuffer(framebuffer)
+        self.init_data(zero_copy)
+        self.init_attach(attach, initialize, frame_store, frame_key)
+
+        # Optionally rotate by remapping the display memory addresses instead
+        # of rotating every frame; _remap_rotate is the rotation that the
+        # init sequence should set up
+        self._hardware_rotate = hardware_rotate and rotate != 0 and \
+            (width, height) in self._hardware_rotate_dimensions()
+        self._remap_rotate = rotate if self._hardware_rotate else 0
+        self.init_scroll_buffer(scroll_buffer)
+
+        # Optionally queue up each frame's commands and data, sending them in
+        # as few serial transactions as possible
+        self._batch = nullcontext()
+        if batch:
+            self._serial_interface = self._batch = serial_batch(self._serial_interface)
 
         if (width, height) not in self._supported_dimensions():
             raise luma.core.error.DeviceDisplayModeError(
                 f"Unsupported display mode: {width} x {height}")
 
-        self._init_sequence()
-        self.contrast(0xFF)
-        self.clear()
-        self.show()
+        # Chooses the windows to send for the changed areas of each frame;
+        # the plan for the last frame is kept in damage_plan. Frames are
+        # planned as encoded, which is still rotated when hardware rotating
+        width, height = self.size if self._hardware_rotate else (self._w, self._h)
+        self.damage_planner = damage_planner(width, height, 2, *self._WINDOW_SETUP)
+        self.damage_plan = None
+
+        with self._batch:
+            if self._initialize:
+                self._init_sequence()
+                self.contrast(0xFF)
+            self.startup()
 
     @abstractmethod
     def _supported_dimensions(self):
@@ -63,35 +101,81 @@ class color_device(device, __framebuffer_mixin):
         """
         pass  # pragma: no cover
 
+    def _hardware_rotate_dimensions(self):
+        """
+        Enumerates the screen resolutions for which the specific device can
+        rotate the display by remapping its memory addresses (with vertical
+        address increment for 90° and 270°), in the same form as
+        :func:`_supported_dimensions`. None by default.
+        """
+        return []
+
     def _apply_offsets(self, bbox):
         return bbox
 
+    def _prerotate(self, image):
+        return image if self._hardware_rotate else self.preprocess(image)
+
     def display(self, image):
         """
-        Renders a 24-bit RGB image to the Color OLED display.
+        Renders a 24-bit RGB or palette ("P" mode) image to the Color OLED
+        display.
 
         :param image: The image to render.
         :type image: PIL.Image.Image
         """
-        assert image.mode == self.mode
+        assert image.mode in (self.mode, "P")
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        self._display_rgb565(rgb565(image))
 
-        for image, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = self._apply_offsets(bounding_box)
-            width = right - left
-            height = bottom - top
+    def display_rgb565(self, data):
+        """
+        Renders pre-encoded 16-bit RGB565 pixel data to the Color OLED
+        display, without decoding it first. Changes are still tracked by the
+        framebuffer, in the same way as for :func:`display`.
 
-            self._set_position(top, right, bottom, left)
+        :param data: Two bytes per pixel (high byte first) in row order,
+            covering the full width and height of the device.
+        :type data: bytes, bytearray or memoryview
 
-            i = 0
-            buf = bytearray(width * height * 2)
-            for r, g, b in image.getdata():
-                if not r == g == b == 0:
-                    # 65K format 1
-                    buf[i] = r & 0xF8 | g >> 5
-                    buf[i + 1] = g << 3 & 0xE0 | b >> 3
-                i += 2
+        .. versionadded:: 3.16.0
+        """
+        assert len(data) == self.width * self.height * 2
+
+        self._display_rgb565(rgb565_frombytes(self.size, data))
+
+    def _display_rgb565(self, encoded):
+        # The framebuffer diffs the encoded image, so that frames from either
+        # display method can be compared against each other
+        image = self.roll_frame(self._prerotate(encoded))
+        self.damage_plan = self._plan_windows(
+            [bounding_box for _, bounding_box in self.framebuffer.redraw(image)])
+
+        with self._batch:
+            for bounding_box in self.damage_plan.windows:
+                self._write_window(image, bounding_box)
+            self.update_start_line()
 
-            self.data(list(buf))
+        self.save_frame(encoded)
+
+    def _plan_windows(self, bounding_boxes):
+        return self.damage_planner.plan(bounding_boxes)
+
+    def _write_window(self, image, bounding_box):
+        left, top, right, bottom = self._apply_offsets(bounding_box)
+        if self._remap_rotate % 2 == 0:
+            self._set_position(top, right, bottom, left)
+        else:
+            # With vertical address increment, the display memory columns
+            # run down the image and rows across it
+            self._set_position(left, bottom, right, top)
+        self.data_buffer(pack_rgb565(image.crop(bounding_box)))
+
+    def _frame_bytes(self, encoded):
+        # Frames are kept as RGB565, and restored with display_rgb565()
+        return pack_rgb565(encoded)
+
+    def _replay_frame(self, data):
+        if len(data) == self.width * self.height * 2:
+            self.display_rgb565(data)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Planning which windows of display memory to rewrite, given the areas of a
+frame that have changed.
+
+.. versionadded:: 3.16.0
+"""
+
+from collections import namedtuple
+
+# Rough cost of each separate command() or data() call to the serial
+# interface, in byte times: bus framing (I²C start and address, SPI chip
+# select and DC changes) plus the Python overhead of each call.
+TRANSACTION_BYTES = 16
+
+damage_plan = namedtuple("damage_plan", ["windows", "cost", "unplanned_cost"])
+damage_plan.__doc__ = """
+The windows chosen by :py:meth:`damage_planner.plan`, in the order they are
+sent, along with their estimated cost in byte times, and the cost of sending
+each changed area as a separate window instead.
+"""
+
+copy_plan = namedtuple("copy_plan", ["source", "destination", "saving"])
+copy_plan.__doc__ = """
+A window of display memory moved with a hardware copy before a frame's
+changed areas are sent, as ``(left, top, right, bottom)`` boxes, along with
+the estimated number of byte times saved by not sending its pixels.
+"""
+
+
+class damage_planner(object):
+    """
+    Decides how to send the changed areas of a frame, by estimating the bus
+    cost of each window of display memory to be rewritten: the pixel data,
+    plus the commands that set up the window, plus a fixed overhead for each
+    serial transaction. Changed areas are merged wherever the merged window
+    costs less to send than the separate ones (saving on setup at the cost
+    of resending some unchanged pixels), up to sending the whole frame.
+
+    Changed areas are never split here: the framebuffer decides how finely
+    a frame is divided up (e.g. ``diff_to_previous(num_segments=...)``).
+
+    :param width: The width of the frame.
+    :type width: int
+    :param height: The height of the frame.
+    :type height: int
+    :param bytes_per_pixel: The number of bytes of pixel data per pixel.
+    :type bytes_per_pixel: float
+    :param setup_bytes: The number of command bytes that set up a window.
+    :type setup_bytes: int
+    :param setup_transactions: The number of serial transactions that these
+        are sent in (the pixel data is sent in one more).
+    :type setup_transactions: int
+    :param align: A function to widen a window to what the controller can
+        address, e.g. whole bytes of packed pixels, or ``None``.
+    :param transaction_bytes: The fixed cost of each serial transaction, in
+        byte times.
+    :type transaction_bytes: int
+    """
+
+    def __init__(self, width, height, bytes_per_pixel, setup_bytes=6,
+                 setup_transactions=1, align=None, transaction_bytes=TRANSACTION_BYTES):
+        self.width = width
+        self.height = height
+        self.bytes_per_pixel = bytes_per_pixel
+        self.setup_bytes = setup_bytes
+        self.setup_transactions = setup_transactions
+        self.align = align or (lambda bounding_box: bounding_box)
+        self.transaction_bytes = transaction_bytes
+
+    def cost(self, window):
+        """
+        Estimates the cost in byte times of rewriting a window.
+
+        :param window: The ``(left, top, right, bottom)`` of the window.
+        :type window: tuple
+        :rtype: float
+        """
+        left, top, right, bottom = window
+        return self.setup_bytes + \
+            (self.setup_transactions + 1) * self.transaction_bytes + \
+            (right - left) * (bottom - top) * self.bytes_per_pixel
+
+    def plan(self, bounding_boxes, area=None):
+        """
+        Chooses the windows to rewrite for the changed areas of a frame.
+
+        :param bounding_boxes: The changed areas, e.g. as yielded by
+            ``framebuffer.redraw()``.
+        :type bounding_boxes: list
+        :param area: The ``(left, top, right, bottom)`` of the part of the
+            frame that may be rewritten, if not all of it.
+        :type area: tuple
+        :rtype: damage_plan
+        """
+        windows = [self.align(bounding_box) for bounding_box in bounding_boxes]
+        unplanned_cost = sum(self.cost(window) for window in windows)
+
+        # Repeatedly make the merge that saves the most, until none do
+        while len(windows) > 1:
+            best = None
+            for i in range(len(windows)):
+                for j in range(i + 1, len(windows)):
+                    merged = self.align(_union(windows[i], windows[j]))
+                    saving = self.cost(windows[i]) + self.cost(windows[j]) - self.cost(merged)
+                    if saving > 0 and (best is None or saving > best[0]):
+                        best = (saving, i, j, merged)
+
+            if best is None:
+                break
+
+            _, i, j, merged = best
+            windows[i] = merged
+            del windows[j]
+
+        cost = sum(self.cost(window) for window in windows)
+        whole_frame = self.align(area or (0, 0, self.width, self.height))
+        if windows and self.cost(whole_frame) < cost:
+            windows, cost = [whole_frame], self.cost(whole_frame)
+
+        return damage_plan(windows, cost, unplanned_cost)
+
+
+def _union(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+
+class __data_mixin(object):
+    """
+    Helper class for sending encoded pixel buffers to the serial interface.
+
+    .. versionadded:: 3.16.0
+    """
+    def init_data(self, zero_copy):
+        """
+        :param zero_copy: If ``True``, encoded buffers are passed to the serial
+            interface as-is (``bytes``, ``bytearray`` or ``memoryview``) rather
+            than first being copied into a list of ints.
+        :type zero_copy: bool
+        """
+        self._zero_copy = zero_copy
+
+    def data_buffer(self, buf):
+        """
+        Sends an encoded pixel buffer through to the delegated serial
+        interface, either directly or as a list for serial interfaces that
+        only accept lists.
+
+        :param buf: The encoded pixel data.
+        :type buf: bytes, bytearray or memoryview
+        """
+        self.data(buf if self._zero_copy else list(buf))
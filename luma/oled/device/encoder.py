@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Bulk pixel encoders, shared by the device drivers to convert PIL images into
+the byte layout expected by the display controller GDDRAM, along with helpers
+to compare previously encoded buffers.
+
+.. versionadded:: 3.16.0
+"""
+
+from PIL import Image, ImageChops
+
+# The transpose that turns each column of an image (after rotating it by the
+# device rotate capability) into a row, ready for PIL to pack into bytes.
+_PAGE_TRANSPOSE = {
+    0: Image.Transpose.ROTATE_270,
+    1: Image.Transpose.ROTATE_180,
+    2: Image.Transpose.ROTATE_90,
+    3: None
+}
+
+# Per-channel lookup tables for RGB565 ("65K format 1") encoding: the high
+# byte holds RRRRRGGG and the low byte GGGBBBBB. Each pair of tables sets
+# disjoint bits, so the two channels can be combined with a simple add.
+_RGB565_RED_HIGH = [v & 0xF8 for v in range(256)]
+_RGB565_GREEN_HIGH = [v >> 5 for v in range(256)]
+_RGB565_GREEN_LOW = [v << 3 & 0xE0 for v in range(256)]
+_RGB565_BLUE_LOW = [v >> 3 for v in range(256)]
+
+# RGB to greyscale conversion matrix, such that PIL computes the simplified
+# luma (r * 306 + g * 601 + b * 117) >> 10. The -0.5 offset counteracts the
+# rounding PIL applies, so the result is truncated instead.
+_LUMA_MATRIX = (306 / 1024, 601 / 1024, 117 / 1024, -0.5)
+
+# Translation tables to reduce 8-bit greyscale to 4 bits, placed in the high
+# or low nibble, or repeated in both.
+_HIGH_NIBBLE = bytes(v & 0xF0 for v in range(256))
+_LOW_NIBBLE = bytes(v >> 4 for v in range(256))
+_DOUBLED_NIBBLE = bytes((v >> 4) * 0x11 for v in range(256))
+
+
+def pack_pages(image, rotate=0):
+    """
+    Packs a 1-bit image into vertical page bytes: each page covers eight pixel
+    rows, and each byte within a page holds one column of eight pixels with
+    the topmost pixel in the least significant bit. Pages are laid out one
+    after the other, giving ``width * height / 8`` bytes in total.
+
+    Rather than visiting each pixel, the image is rotated 270° so that PIL
+    packs every column into bytes itself; the resulting bytes are then
+    de-interleaved into page order with slicing. Any rotation the image
+    still needs is folded into that same transpose: for 270° the image is
+    packed as it is, without any transpose at all.
+
+    :param image: A mode "1" image whose height (or, when rotating by 90° or
+        270°, width) is a multiple of 8.
+    :type image: PIL.Image.Image
+    :param rotate: An integer value of 0 (default), 1, 2 or 3, with the same
+        meaning as the ``rotate`` device capability, giving the rotation to
+        apply before packing.
+    :type rotate: int
+    :rtype: bytes
+    """
+    pages = (image.height if rotate % 2 == 0 else image.width) // 8
+    method = _PAGE_TRANSPOSE[rotate]
+    data = (image if method is None else image.transpose(method)).tobytes()
+    return b"".join(data[pages - 1 - page::pages] for page in range(pages))
+
+
+def rgb565(image):
+    """
+    Encodes a 24-bit RGB or palette image as 16-bit RGB565. Rather than
+    returning bytes, the high and low byte of each pixel are held in the red
+    and green bands of a new "RGB" image (the blue band is unused), so that
+    the encoded pixels can still be rotated, cropped and diffed with PIL; use
+    :func:`pack_rgb565` to get the bytes for the device.
+
+    RGB images have each channel mapped through a lookup table with
+    :py:meth:`PIL.Image.Image.point` and the high and low bytes assembled
+    from pairs of channels. Palette images instead have their pixel indices
+    translated through tables built from the 256-entry palette.
+
+    :param image: A mode "RGB" or "P" image.
+    :type image: PIL.Image.Image
+    :rtype: PIL.Image.Image
+    """
+    if image.mode == "P":
+        palette = image.getpalette("RGB")
+        palette += [0] * (768 - len(palette))
+        colors = list(zip(palette[0::3], palette[1::3], palette[2::3]))
+        data = image.tobytes()
+        high = data.translate(bytes(r & 0xF8 | g >> 5 for r, g, _ in colors))
+        low = data.translate(bytes(g << 3 & 0xE0 | b >> 3 for _, g, b in colors))
+        return _rgb565_image(image.size, high, low)
+
+    r, g, b = image.split()
+    high = ImageChops.add(r.point(_RGB565_RED_HIGH), g.point(_RGB565_GREEN_HIGH))
+    low = ImageChops.add(g.point(_RGB565_GREEN_LOW), b.point(_RGB565_BLUE_LOW))
+    return Image.merge("RGB", (high, low, Image.new("L", image.size)))
+
+
+def rgb565_frombytes(size, data):
+    """
+    Wraps pre-encoded RGB565 pixel data (big-endian, two bytes per pixel in
+    row order) in an image, in the same form as returned by :func:`rgb565`.
+
+    :param size: The width and height of the image.
+    :type size: tuple
+    :param data: The encoded pixel data.
+    :type data: bytes, bytearray or memoryview
+    :rtype: PIL.Image.Image
+    """
+    return _rgb565_image(size, bytes(data[0::2]), bytes(data[1::2]))
+
+
+def _rgb565_image(size, high, low):
+    return Image.merge("RGB", (
+        Image.frombytes("L", size, high),
+        Image.frombytes("L", size, low),
+        Image.new("L", size)))
+
+
+def pack_rgb565(image):
+    """
+    Interleaves the high and low bytes of an image returned by :func:`rgb565`
+    or :func:`rgb565_frombytes`, giving the RGB565 bytes for the device.
+
+    :param image: An encoded RGB565 image.
+    :type image: PIL.Image.Image
+    :rtype: bytes
+    """
+    high, low, _ = image.split()
+    return Image.merge("LA", (high, low)).tobytes()
+
+
+def greyscale(image):
+    """
+    Converts a mode "1" or "RGB" image to 8-bit greyscale. RGB pixels use a
+    simplified luma calculation based on *Y'=0.299R'+0.587G'+0.114B'*, and
+    monochrome pixels become either 0 or 255. Mode "L" images are returned
+    as-is.
+
+    :param image: A mode "1", "L" or "RGB" image.
+    :type image: PIL.Image.Image
+    :rtype: PIL.Image.Image
+    """
+    if image.mode == "L":
+        return image
+    if image.mode == "RGB":
+        return image.convert("L", _LUMA_MATRIX)
+    return image.convert("L")
+
+
+def pack_nibbles(image, nibble_order):
+    """
+    Encodes an image as 4-bit greyscale, two pixels per byte in row order.
+
+    :param image: A mode "1", "L" or "RGB" image with an even number of pixels.
+    :type image: PIL.Image.Image
+    :param nibble_order: 0 if the first (leftmost) pixel of each pair goes in
+        the high nibble, or 1 if it goes in the low nibble.
+    :type nibble_order: int
+    :rtype: bytearray
+    """
+    data = greyscale(image).tobytes()
+    first, second = data[0::2], data[1::2]
+    high, low = (first, second) if nibble_order == 0 else (second, first)
+
+    # The nibbles occupy disjoint bits, so combine them all at once
+    size = len(high)
+    high = int.from_bytes(high.translate(_HIGH_NIBBLE), "big")
+    low = int.from_bytes(low.translate(_LOW_NIBBLE), "big")
+    return bytearray((high | low).to_bytes(size, "big"))
+
+
+def pack_doubled_nibbles(image):
+    """
+    Encodes an image as 4-bit greyscale, one pixel per byte with the 4-bit
+    value repeated in both nibbles.
+
+    :param image: A mode "1", "L" or "RGB" image.
+    :type image: PIL.Image.Image
+    :rtype: bytearray
+    """
+    return bytearray(greyscale(image).tobytes().translate(_DOUBLED_NIBBLE))
+
+
+def changed_spans(previous, current, width):
+    """
+    Compares two page buffers (as produced by :func:`pack_pages`) a page at a
+    time, and yields ``(page, start, end)`` tuples giving the smallest run of
+    columns within each page that differs. Pages that are identical are
+    skipped entirely; if there is no previous buffer, every page is yielded
+    in full.
+
+    :param previous: The buffer last sent to the device, or ``None``.
+    :type previous: bytes
+    :param current: The buffer about to be sent to the device.
+    :type current: bytes
+    :param width: The number of bytes (columns) in each page.
+    :type width: int
+    """
+    for offset in range(0, len(current), width):
+        page = offset // width
+        if previous is None:
+            yield page, 0, width
+            continue
+
+        prev_page = previous[offset:offset + width]
+        curr_page = current[offset:offset + width]
+        if prev_page == curr_page:
+            continue
+
+        start = 0
+        while prev_page[start] == curr_page[start]:
+            start += 1
+
+        end = width
+        while prev_page[end - 1] == curr_page[end - 1]:
+            end -= 1
+
+        yield page, start, end
+
+
+def changed_windows(previous, current, width):
+    """
+    Groups the runs of changed columns found by :func:`changed_spans` into
+    windows over consecutive pages, for controllers that can write a range
+    of pages and columns in one go. Yields ``(first_page, last_page, start,
+    end)`` tuples, where ``last_page`` and ``end`` are exclusive and the
+    columns cover the changed runs of every page in the window.
+
+    :param previous: The buffer last sent to the device, or ``None``.
+    :type previous: bytes
+    :param current: The buffer about to be sent to the device.
+    :type current: bytes
+    :param width: The number of bytes (columns) in each page.
+    :type width: int
+    """
+    window = None
+    for page, start, end in changed_spans(previous, current, width):
+        if window is not None and window[1] == page:
+            window = (window[0], page + 1, min(window[2], start), max(window[3], end))
+            continue
+
+        if window is not None:
+            yield window
+        window = (page, page + 1, start, end)
+
+    if window is not None:
+        yield window
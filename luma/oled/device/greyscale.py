@@ -9,33 +9,64 @@ Base class for SSD13xx greyscale devices
 """
 
 from abc import abstractmethod, ABCMeta
+from contextlib import nullcontext
 
 from luma.core.device import device
 import luma.core.error
 import luma.oled.const
 from luma.oled.device.framebuffer_mixin import __framebuffer_mixin
+from luma.oled.device.data_mixin import __data_mixin
+from luma.oled.device.attach_mixin import __attach_mixin
+from luma.oled.device.scroll_buffer_mixin import __scroll_buffer_mixin
+from luma.oled.device.batch import serial_batch
+from luma.oled.device.encoder import pack_nibbles
+from luma.oled.device.damage import damage_planner
 
 
-class greyscale_device(device, __framebuffer_mixin):
+class greyscale_device(device, __framebuffer_mixin, __data_mixin, __attach_mixin,
+                       __scroll_buffer_mixin):
     __metaclass__ = ABCMeta
 
+    # The command bytes sent by _set_position, and the number of command()
+    # and data() calls that they are sent in
+    _WINDOW_SETUP = (6, 1)
+
     def __init__(self, const, serial_interface, width, height, rotate, mode,
-                 framebuffer, nibble_order, **kwargs):
+                 framebuffer, nibble_order, zero_copy=False, batch=False,
+                 attach=False, initialize=True, frame_store=None, frame_key=None, scroll_buffer=False, **kwargs):
         super(greyscale_device, self).__init__(const, serial_interface)
-        self.capabilities(width, height, rotate, mode)
+        # luma.core does not know about mode "L", so it is assigned afterwards
+        self.capabilities(width, height, rotate, "RGB" if mode == "L" else mode)
+        self.mode = mode
         self.init_framebuffer(framebuffer)
+        self.init_data(zero_copy)
+        self.init_attach(attach, initialize, frame_store, frame_key)
+        self.init_scroll_buffer(scroll_buffer)
+
+        # Optionally queue up each frame's commands and data, sending them in
+        # as few serial transactions as possible
+        self._batch = nullcontext()
+        if batch:
+            self._serial_interface = self._batch = serial_batch(self._serial_interface)
 
-        self._populate = self._render_mono if mode == "1" else self._render_greyscale
         self._nibble_order = nibble_order
 
         if (width, height) not in self._supported_dimensions():
             raise luma.core.error.DeviceDisplayModeError(
                 f"Unsupported display mode: {width} x {height}")
 
-        self._init_sequence()
-        self.contrast(0x7F)
-        self.clear()
-        self.show()
+        # Chooses the windows to send for the changed areas of each frame,
+        # at two pixels per byte; the plan for the last frame is kept in
+        # damage_plan
+        self.damage_planner = damage_planner(self._w, self._h, 0.5, *self._WINDOW_SETUP,
+                                             align=self._inflate_bbox)
+        self.damage_plan = None
+
+        with self._batch:
+            if self._initialize:
+                self._init_sequence()
+                self.contrast(0x7F)
+            self.startup()
 
     @abstractmethod
     def _supported_dimensions(self):
@@ -66,33 +97,6 @@ class greyscale_device(device, __framebuffer_mixin):
         """
         pass  # pragma: no cover
 
-    def _render_mono(self, buf, pixel_data):
-        i = 0
-        nibble_order = self._nibble_order
-        for pix in pixel_data:
-            if pix > 0:
-                if i % 2 == nibble_order:
-                    buf[i // 2] |= 0xF0
-                else:
-                    buf[i // 2] |= 0x0F
-
-            i += 1
-
-    def _render_greyscale(self, buf, pixel_data):
-        i = 0
-        nibble_order = self._nibble_order
-        for r, g, b in pixel_data:
-            # RGB->Greyscale luma calculation into 4-bits
-            grey = (r * 306 + g * 601 + b * 117) >> 14
-
-            if grey > 0:
-                if i % 2 == nibble_order:
-                    buf[i // 2] |= (grey << 4)
-                else:
-                    buf[i // 2] |= grey
-
-            i += 1
-
     def _inflate_bbox(self, bounding_box):
         """
         Realign the left and right edges of the bounding box such that they are
@@ -110,9 +114,10 @@ class greyscale_device(device, __framebuffer_mixin):
 
     def display(self, image):
         """
-        Takes a 1-bit monochrome or 24-bit RGB image and renders it
-        to the greyscale OLED display. RGB pixels are converted to 4-bit
-        greyscale values using a simplified Luma calculation, based on
+        Takes a 1-bit monochrome, 8-bit greyscale or 24-bit RGB image and
+        renders it to the greyscale OLED display. Greyscale pixels are
+        quantized to 4 bits directly, whereas RGB pixels are converted to
+        4-bit greyscale values using a simplified Luma calculation, based on
         *Y'=0.299R'+0.587G'+0.114B'*.
 
         :param image: The image to render.
@@ -121,15 +126,17 @@ class greyscale_device(device, __framebuffer_mixin):
         assert image.mode == self.mode
         assert image.size == self.size
 
-        image = self.preprocess(image)
+        rotated = self.roll_frame(self.preprocess(image))
+
+        self.damage_plan = self.damage_planner.plan(
+            [bounding_box for _, bounding_box in self.framebuffer.redraw(rotated)])
+
+        with self._batch:
+            for left, top, right, bottom in self.damage_plan.windows:
+                cropped_image_segment = rotated.crop((left, top, right, bottom))
 
-        for _, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = self._inflate_bbox(bounding_box)
-            cropped_image_segment = image.crop((left, top, right, bottom))
-            width = right - left
-            height = bottom - top
+                self._set_position(top, right, bottom, left)
+                self.data_buffer(pack_nibbles(cropped_image_segment, self._nibble_order))
+            self.update_start_line()
 
-            buf = bytearray(width * height >> 1)
-            self._set_position(top, right, bottom, left)
-            self._populate(buf, cropped_image_segment.getdata())
-            self.data(list(buf))
+        self.save_frame(image)
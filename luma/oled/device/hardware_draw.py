@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Drawing with the graphics acceleration commands of the SSD1331, which can
+draw lines and rectangles, and clear areas, without being sent any pixels.
+
+.. versionadded:: 3.16.0
+"""
+
+from PIL import Image, ImageColor, ImageDraw
+
+
+class hardware_draw(object):
+    """
+    A stand-in for :py:class:`PIL.ImageDraw.ImageDraw` that draws onto the
+    image as usual, while recording the rectangles, lines and cleared areas
+    that the display can draw for itself. Everything else (text, ellipses,
+    diagonal lines and so on) is passed straight through to ``ImageDraw``,
+    and reaches the display as pixels.
+
+    :param image: The image to draw onto.
+    :type image: PIL.Image.Image
+    """
+
+    def __init__(self, image):
+        self._draw = ImageDraw.Draw(image)
+        self._size = image.size
+        self.primitives = []
+
+    def __getattr__(self, attr):
+        return getattr(self._draw, attr)
+
+    def rectangle(self, xy, fill=None, outline=None, width=1):
+        """
+        Draws a rectangle, as :py:meth:`PIL.ImageDraw.ImageDraw.rectangle`.
+        A rectangle with a one pixel outline (or no outline, in which case
+        the fill colour is used for it) is recorded for the display to draw.
+        """
+        self._draw.rectangle(xy, fill=fill, outline=outline, width=width)
+
+        box = self._box(xy)
+        if outline is None:
+            outline = fill
+        outline, fill = _rgb(outline), _rgb(fill)
+        if box is None or width != 1 or not outline or fill is False:
+            return
+
+        if box[0] == box[2] or box[1] == box[3]:
+            # All outline, which the display draws as a line (ImageDraw can
+            # draw a row beyond the box, which is left to be sent as pixels)
+            self.primitives.append(("line", box, outline))
+        else:
+            self.primitives.append(("rectangle", box, outline, fill))
+
+    def line(self, xy, fill=None, width=1, joint=None):
+        """
+        Draws a line, as :py:meth:`PIL.ImageDraw.ImageDraw.line`. A one pixel
+        wide horizontal or vertical line is recorded for the display to draw;
+        other lines are left as pixels, as the display may not pick exactly
+        the same pixels for them.
+        """
+        self._draw.line(xy, fill=fill, width=width, joint=joint)
+
+        box = self._box(xy)
+        color = _rgb(fill)
+        if box is not None and width == 1 and color and \
+                (box[0] == box[2] or box[1] == box[3]):
+            self.primitives.append(("line", box, color))
+
+    def clear(self, xy=None):
+        """
+        Clears an area of the image to black, or the whole image if no area
+        is given.
+
+        :param xy: The ``(left, top, right, bottom)`` of the area, inclusive
+            of the right and bottom edges, as for ``rectangle``.
+        """
+        if xy is None:
+            xy = (0, 0, self._size[0] - 1, self._size[1] - 1)
+        self._draw.rectangle(xy, fill=(0, 0, 0))
+
+        box = self._box(xy)
+        if box is not None:
+            self.primitives.append(("clear", box))
+
+    def _box(self, xy):
+        # Two corners as integers, entirely on the image, else None
+        points = list(xy)
+        if len(points) == 2 and all(isinstance(p, (list, tuple)) for p in points):
+            points = [*points[0], *points[1]]
+        if len(points) != 4 or not all(isinstance(p, int) for p in points):
+            return None
+
+        left, top, right, bottom = points
+        width, height = self._size
+        if 0 <= left <= right < width and 0 <= top <= bottom < height:
+            return (left, top, right, bottom)
+
+
+class accelerated_canvas(object):
+    """
+    A canvas like :py:class:`luma.core.render.canvas`, returning a
+    :py:class:`hardware_draw` object to draw upon. As soon as the with-block
+    completes, the rectangles, lines and cleared areas are drawn by the
+    display itself, and then just the pixels that still differ are sent.
+
+    :param device: The device to draw on, which must support
+        ``display_accelerated()``.
+    :param background: An image to draw onto, rather than a blank one.
+    :type background: PIL.Image.Image
+    """
+
+    def __init__(self, device, background=None):
+        self.draw = None
+        if background is None:
+            self.image = Image.new(device.mode, device.size)
+        else:
+            assert background.size == device.size
+            self.image = background.copy()
+        self.device = device
+
+    def __enter__(self):
+        self.draw = hardware_draw(self.image)
+        return self.draw
+
+    def __exit__(self, type, value, traceback):
+        if type is None:
+            self.device.display_accelerated(self.image, self.draw.primitives)
+
+        del self.draw   # Tidy up the resources
+        return False    # Never suppress exceptions
+
+
+def _rgb(color):
+    # An RGB tuple, None for no colour, or False for one the display can't
+    # be given (e.g. palette indices or translucent colours)
+    if color is None:
+        return None
+    if isinstance(color, str):
+        try:
+            color = ImageColor.getrgb(color)
+        except ValueError:
+            return False
+    if isinstance(color, tuple) and len(color) == 3 and \
+            all(isinstance(c, int) and 0 <= c <= 255 for c in color):
+        return color
+    return False
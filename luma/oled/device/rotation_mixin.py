@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+
+class __rotation_mixin(object):
+    """
+    Helper class for page-addressed monochrome drivers that can rotate the
+    display without a separate :func:`preprocess` pass over every frame:
+    180° by mirroring the segment and COM scan order in the controller, and
+    any remaining rotation while the image is being packed into pages.
+
+    .. versionadded:: 3.16.0
+    """
+    def init_rotation(self, hardware_rotate, mirrorable=True):
+        """
+        Must be called after the device capabilities have been set.
+
+        :param hardware_rotate: If ``True``, images are rotated by the
+            controller and page encoder rather than by :func:`preprocess`.
+        :type hardware_rotate: bool
+        :param mirrorable: Whether the controller can flip the panel through
+            180° for the current geometry.
+        :type mirrorable: bool
+        """
+        self._hardware_rotate = hardware_rotate
+        self._mirrored = hardware_rotate and mirrorable and self.rotate in (1, 2)
+        if not hardware_rotate:
+            self._encode_rotate = 0
+        elif self._mirrored:
+            self._encode_rotate = self.rotate ^ 2
+        else:
+            self._encode_rotate = self.rotate
+
+    def segment_remap(self):
+        """
+        The SEGREMAP command for the current orientation: 0xA1 (column 127
+        mapped to SEG0) normally, or 0xA0 when mirrored.
+        """
+        return 0xA0 if self._mirrored else 0xA1
+
+    def com_scan_direction(self):
+        """
+        The COM scan direction command for the current orientation: 0xC8
+        (remapped) normally, or 0xC0 when mirrored.
+        """
+        return 0xC0 if self._mirrored else 0xC8
+
+    def prerotate(self, image):
+        """
+        Rotates the image with :func:`preprocess`, unless the rotation is done
+        by the controller and the page encoder instead.
+        """
+        return image if self._hardware_rotate else self.preprocess(image)
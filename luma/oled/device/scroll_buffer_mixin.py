@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+from PIL import ImageChops
+
+
+class __scroll_buffer_mixin(object):
+    """
+    Helper class for drivers that can use display memory as a ring buffer,
+    by changing the display start line (the row of display memory shown at
+    the top of the display). When a frame is the last one moved up by some
+    number of rows, as in a scrolling log, the rows that were already there
+    are left in place: only the newly exposed rows are rewritten, and the
+    start line is moved on to show them.
+
+    This only works where the display shows every row of display memory,
+    and not with hardware rotation.
+
+    .. versionadded:: 3.16.0
+    """
+    def init_scroll_buffer(self, scroll_buffer):
+        """
+        Must be called after the device capabilities (and, if applicable,
+        hardware rotation) have been set.
+
+        :param scroll_buffer: If ``True``, scroll frames through display
+            memory where the geometry allows.
+        :type scroll_buffer: bool
+        """
+        self._scroll_buffer = scroll_buffer and \
+            (self._w, self._h) in self._scroll_buffer_dimensions() and \
+            not getattr(self, "_hardware_rotate", False)
+        self._start_line = 0
+        # When attaching, the start line the display was left at is unknown
+        self._shown_start_line = None if self._scroll_buffer and \
+            getattr(self, "_attach", False) else 0
+        self._scroll_rows = None
+
+    def _scroll_buffer_dimensions(self):
+        """
+        Enumerates the screen resolutions at which the display shows every
+        row of display memory. None by default.
+        """
+        return []
+
+    def _set_start_line(self, line):
+        """
+        Sends the command to show the given row of display memory at the top
+        of the display.
+        """
+        pass  # pragma: no cover
+
+    def roll_frame(self, image):
+        """
+        Works out whether the frame has moved up since the last one, and
+        returns it rolled into display memory order around the start line
+        that will show it. Once the frame has been sent, the start line must
+        be moved with :func:`update_start_line`.
+
+        :param image: The frame, in display memory orientation.
+        :type image: PIL.Image.Image
+        :rtype: PIL.Image.Image
+        """
+        if not self._scroll_buffer:
+            return image
+
+        rows = _rows(image)
+        if self._scroll_rows is not None:
+            shift = _scrolled_rows(self._scroll_rows, rows)
+            self._start_line = (self._start_line + shift) % len(rows)
+        self._scroll_rows = rows
+
+        return ImageChops.offset(image, 0, self._start_line) if self._start_line else image
+
+    def update_start_line(self):
+        """
+        Shows the frame last returned by :func:`roll_frame`, if that needs
+        the start line to move.
+        """
+        if self._start_line != self._shown_start_line:
+            self._set_start_line(self._start_line)
+            self._shown_start_line = self._start_line
+
+
+def _rows(image):
+    data = image.tobytes()
+    size = len(data) // image.height
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _scrolled_rows(previous, current):
+    # How many rows the frame has moved up by, where rolling display memory
+    # that far leaves fewer rows to rewrite than not moving at all; only the
+    # shifts that line the top row up with one from the last frame are tried
+    height = len(current)
+    best = 0
+    best_changed = sum(p != c for p, c in zip(previous, current))
+    for shift in range(1, height):
+        if best_changed == 0:
+            break
+        if previous[shift] != current[0]:
+            continue
+
+        changed = 0
+        for row in range(1, height):
+            if previous[(row + shift) % height] != current[row]:
+                changed += 1
+                if changed >= best_changed:
+                    break
+        else:
+            best, best_changed = shift, changed
+
+    return best
@@ -27,3 +27,13 @@ def assert_invalid_dimensions(deviceType, serial_interface, width, height):
     with pytest.raises(luma.core.error.DeviceDisplayModeError) as ex:
         deviceType(serial_interface, width=width, height=height, framebuffer=full_frame())
     assert f"Unsupported display mode: {width} x {height}" in str(ex.value)
+
+
+def wire_format(recordings):
+    """
+    Flattens a list of ``{'command': [...]}`` / ``{'data': [...]}`` recordings
+    into the DC-framed byte stream that would reach the device, so that
+    recordings can be compared regardless of how the bytes were grouped into
+    transactions.
+    """
+    return [(kind, byte) for r in recordings for kind, values in r.items() for byte in values]
@@ -5,6 +5,7 @@
 
 from luma.oled.device import ch1115
 from luma.core.render import canvas
+from luma.core.framebuffer import diff_to_previous
 
 from baseline_data import get_reference_data, primitives
 from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
@@ -36,7 +37,7 @@ def test_init_128x64():
 
     # Next 1024 are all data: zero's to clear the RAM
     # (1024 = 128 * 64 / 8)
-    serial.data.assert_has_calls([call(bytearray([0] * 128))] * 8)
+    serial.data.assert_has_calls([call([0] * 128)] * 8)
 
 
 def test_init_invalid_dimensions():
@@ -78,3 +79,28 @@ def test_display():
     # save_reference_data("demo_ch1115", recordings)
 
     assert recordings == get_reference_data('demo_ch1115')
+
+
+def test_display_diff_to_previous():
+    """
+    CH1115 OLED only sends the changed run of columns within each changed
+    page when using a ``diff_to_previous`` framebuffer.
+    """
+    device = ch1115(serial, framebuffer=diff_to_previous())
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((100, 40), fill="white")
+        draw.point((3, 63), fill="white")
+
+    serial.command.assert_has_calls([
+        # Page 5, column 100 + 2 = 0x66
+        call(181, 6, 22),
+        # Page 7, column 3 + 2 = 0x05
+        call(183, 5, 16)
+    ])
+    assert serial.command.call_count == 2
+    serial.data.assert_has_calls([
+        call([0x01]),
+        call([0x80])
+    ])
@@ -5,6 +5,7 @@
 
 from luma.oled.device import sh1106
 from luma.core.render import canvas
+from luma.core.framebuffer import diff_to_previous
 
 from baseline_data import get_reference_data, primitives
 from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
@@ -77,3 +78,43 @@ def test_display():
     # save_reference_data("demo_sh1106", recordings)
 
     assert recordings == get_reference_data('demo_sh1106')
+
+
+def test_display_diff_to_previous():
+    """
+    SH1106 OLED only sends the changed run of columns within each changed
+    page when using a ``diff_to_previous`` framebuffer.
+    """
+    device = sh1106(serial, framebuffer=diff_to_previous())
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.line((20, 10, 24, 10), fill="white")
+
+    # Page 1, starting at column 20 + 2 = 0x16
+    serial.command.assert_called_once_with(177, 6, 17)
+    serial.data.assert_called_once_with([0x04] * 5)
+
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.line((20, 10, 24, 10), fill="white")
+
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+
+def test_hardware_rotate_offset_panel():
+    """
+    SH1106 OLED panels that are offset within the COM lines cannot be mirrored,
+    so the page encoder does the whole 180° rotation instead.
+    """
+    device = sh1106(serial, width=128, height=32, rotate=2, hardware_rotate=True)
+    assert 0xC8 in serial.command.mock_calls[0].args
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    # Bottom right hand corner, on the last page
+    serial.command.assert_has_calls([call(0xB3, 0x02, 0x10)])
+    serial.data.assert_called_with([0] * 127 + [0x80])
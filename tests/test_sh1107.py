@@ -3,8 +3,12 @@
 # Copyright (c) 2023 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import pytest
+
 from luma.oled.device import sh1107
 from luma.core.render import canvas
+from luma.core.framebuffer import diff_to_previous
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
 from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
@@ -83,3 +87,43 @@ def test_display():
     # save_reference_data("demo_sh1107", recordings)
 
     assert recordings == get_reference_data('demo_sh1107')
+
+
+@pytest.mark.parametrize("width,height", [(64, 128), (80, 128), (128, 128)])
+def test_display_page_packing(width, height):
+    """
+    SH1107 OLED packs each column of eight pixels into a page byte, with the
+    topmost pixel in the least significant bit, and sends a page at a time.
+    """
+    device = sh1107(serial, width=width, height=height)
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    img.putdata([(x * 7 + y * 3) % 5 == 0 for y in range(height) for x in range(width)])
+    device.display(img)
+
+    expected = [[0] * width for _ in range(height // 8)]
+    for y in range(height):
+        for x in range(width):
+            if img.getpixel((x, y)):
+                expected[y // 8][x] |= 1 << (y % 8)
+
+    serial.command.assert_has_calls([call(0x10, 0x00, 0xb0 | page) for page in range(height // 8)])
+    serial.data.assert_has_calls([call(page) for page in expected])
+
+
+def test_display_diff_to_previous():
+    """
+    SH1107 OLED only sends the run of changed columns within each changed
+    page when using a ``diff_to_previous`` framebuffer.
+    """
+    device = sh1107(serial, framebuffer=diff_to_previous())
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((20, 9), fill="white")
+        draw.point((22, 9), fill="white")
+
+    assert serial.mock_calls == [
+        call.command(0x11, 0x04, 0xb1),
+        call.data([0x02, 0x00, 0x02])]
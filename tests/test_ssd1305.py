@@ -3,6 +3,8 @@
 # Copyright (c) 2026 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import pytest
+
 from luma.oled.device import ssd1305
 from luma.core.render import canvas
 from luma.oled.const import ssd1306 as ssd1306_const
@@ -99,3 +101,33 @@ def test_display():
 
     serial.command.assert_called_once_with(ssd1306_const.COLUMNADDR, 4, 131, ssd1306_const.PAGEADDR, 0, 3)
     serial.data.assert_called_once_with(get_reference_data('demo_ssd1305'))
+
+
+def test_display_hardware_rotate():
+    """
+    SSD1305 OLED mirrored by the controller moves the visible columns to the
+    other end of the 132-column display memory.
+    """
+    device = ssd1305(serial, rotate=2, hardware_rotate=True)
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        primitives(device, draw)
+
+    serial.command.assert_called_once_with(ssd1306_const.COLUMNADDR, 0, 127, ssd1306_const.PAGEADDR, 0, 3)
+
+
+def test_scroll_not_supported():
+    """
+    SSD1305 OLED does not offer the SSD1306 scroll commands.
+    """
+    device = ssd1305(serial)
+    serial.reset_mock()
+
+    with pytest.raises(NotImplementedError):
+        device.start_scroll()
+    with pytest.raises(NotImplementedError):
+        device.stop_scroll()
+    with pytest.raises(NotImplementedError):
+        device.set_vertical_scroll_area(0, 32)
+    assert serial.mock_calls == []
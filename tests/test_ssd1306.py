@@ -3,12 +3,18 @@
 # Copyright (c) 2014-2023 Richard Hull and contributors
 # See LICENSE.rst for details.
 
+import os
+import pytest
+
 from luma.oled.device import ssd1306
 from luma.core.render import canvas
+from luma.core.interface.serial import i2c, spi
+from luma.core.framebuffer import diff_to_previous
+from PIL import Image
 
 from baseline_data import primitives, get_reference_data
 from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
-from unittest.mock import call
+from unittest.mock import Mock, call
 
 
 def test_init_128x64():
@@ -124,6 +130,82 @@ def test_init_invalid_dimensions():
     assert_invalid_dimensions(ssd1306, serial, 59, 22)
 
 
+def test_attach():
+    """
+    Attaching to a running SSD1306 re-sends the initialization sequence and
+    switches the display on, but leaves display memory alone until the first
+    frame, which is sent in full.
+    """
+    device = ssd1306(serial, attach=True)
+    serial.data.assert_not_called()
+    assert serial.command.mock_calls[-1] == call(175)
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+    serial.data.assert_called_once_with([1] + [0] * (128 * 64 // 8 - 1))
+
+
+def test_attach_without_initialize():
+    """
+    Attaching without initializing sends nothing at all.
+    """
+    ssd1306(serial, attach=True, initialize=False)
+    assert serial.mock_calls == []
+
+
+def test_attach_frame_store(tmp_path):
+    """
+    The frame store carries the last frame displayed over to the next device
+    attached to the same display, so content already on show is not resent.
+    """
+    device = ssd1306(serial, framebuffer=diff_to_previous(), frame_store=str(tmp_path))
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    serial.reset_mock()
+    device = ssd1306(serial, framebuffer=diff_to_previous(), frame_store=str(tmp_path),
+                     attach=True, initialize=False)
+    assert serial.mock_calls == []
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+        draw.point((127, 63), fill="white")
+    serial.command.assert_called_once_with(33, 127, 127, 34, 7, 7)
+    serial.data.assert_called_once_with([0x80])
+
+
+@pytest.mark.parametrize("make_interface,names", [
+    (lambda node: i2c(bus=Mock(fd=node.fileno()), address=0x3C), ("i2c-1", "i2c-2")),
+    (lambda node: spi(spi=Mock(fileno=Mock(return_value=node.fileno())), gpio=Mock()),
+     ("spidev0.0", "spidev0.1")),
+])
+def test_frame_store_bus(tmp_path, make_interface, names):
+    """
+    Displays that differ only by the I²C bus or SPI device they are on keep
+    separate frames in the same frame store.
+    """
+    frames = tmp_path / "frames"
+    frames.mkdir()
+
+    files = []
+    for name in names:
+        with open(tmp_path / name, "w") as node:
+            device = ssd1306(make_interface(node), frame_store=str(frames))
+            device.display(Image.new("1", device.size))
+        files.append(os.path.basename(device._frame_file))
+
+    assert sorted(os.listdir(frames)) == sorted(files)
+    assert names[0] in files[0] and names[1] in files[1]
+
+
+def test_frame_store_key(tmp_path):
+    """
+    An explicit frame key names the frame in place of the serial interface.
+    """
+    ssd1306(serial, frame_store=str(tmp_path), frame_key="left")
+    assert os.listdir(tmp_path) == ["ssd1306_128x64_rotate0_left.frame"]
+
+
 def test_hide():
     """
     SSD1306 OLED screen content can be hidden.
@@ -165,3 +247,218 @@ def test_display():
 
     # Next 1024 bytes are data representing the drawn image
     serial.data.assert_called_once_with(get_reference_data('demo_ssd1306'))
+
+
+@pytest.mark.parametrize("width,height", [(128, 64), (128, 32), (96, 16), (64, 48), (64, 32)])
+def test_display_page_packing(width, height):
+    """
+    SSD1306 OLED packs each column of eight pixels into a page byte, with the
+    topmost pixel in the least significant bit.
+    """
+    device = ssd1306(serial, width=width, height=height)
+    serial.reset_mock()
+
+    img = Image.new("1", device.size)
+    img.putdata([(x * 7 + y * 3) % 5 == 0 for y in range(height) for x in range(width)])
+    device.display(img)
+
+    expected = [0] * (width * height // 8)
+    for y in range(height):
+        for x in range(width):
+            if img.getpixel((x, y)):
+                expected[width * (y // 8) + x] |= 1 << (y % 8)
+
+    serial.data.assert_called_once_with(expected)
+
+
+def test_display_diff_to_previous():
+    """
+    SSD1306 OLED only sends the changed area, widened to whole pages, when
+    using a ``diff_to_previous`` framebuffer.
+    """
+    device = ssd1306(serial, width=64, height=48, framebuffer=diff_to_previous(num_segments=1))
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((10, 20), fill="white")
+        draw.point((12, 25), fill="white")
+
+    # Columns are offset by 32 on this panel, rows 20-25 are within page 2-3
+    serial.command.assert_called_once_with(33, 42, 44, 34, 2, 3)
+    serial.data.assert_called_once_with([0x10, 0x00, 0x00, 0x00, 0x00, 0x02])
+
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((10, 20), fill="white")
+        draw.point((12, 25), fill="white")
+
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+
+@pytest.mark.parametrize("rotate", [0, 1, 2, 3])
+def test_hardware_rotate(rotate):
+    """
+    SSD1306 OLED with ``hardware_rotate=True`` mirrors the panel for 180°,
+    and otherwise sends the same pages as rotating the image in software.
+    """
+    mirrored = rotate in (1, 2)
+
+    def record(**kwargs):
+        device = ssd1306(serial, width=64, height=48, **kwargs)
+        init = serial.command.mock_calls[0]
+        serial.reset_mock()
+
+        img = Image.new("1", device.size)
+        img.putdata([(x * 7 + y * 3) % 5 == 0 for y in range(device.height) for x in range(device.width)])
+        device.display(img)
+        return init, serial.data.call_args
+
+    init, data = record(rotate=rotate, hardware_rotate=True)
+    _, expected = record(rotate=rotate ^ 2 if mirrored else rotate)
+
+    assert data == expected
+    assert (0xA0 in init.args, 0xC0 in init.args) == (mirrored, mirrored)
+    assert (0xA1 in init.args, 0xC8 in init.args) == (not mirrored, not mirrored)
+
+
+@pytest.mark.parametrize("hardware_rotate,colstart", [(False, 0), (True, 32)])
+def test_hardware_rotate_96x16(hardware_rotate, colstart):
+    """
+    SSD1306 OLED 96 x 16 panels are wired to the right hand end of display
+    memory, so mirroring for 180° moves the columns written to the other end.
+    """
+    device = ssd1306(serial, width=96, height=16, rotate=2,
+                     hardware_rotate=hardware_rotate)
+    serial.reset_mock()
+
+    device.display(Image.new("1", device.size))
+    serial.command.assert_called_once_with(33, colstart, colstart + 95, 34, 0, 1)
+
+
+def test_display_diff_windows():
+    """
+    SSD1306 OLED compares the packed pages with those last sent, sending
+    each run of changed pages as a single window.
+    """
+    device = ssd1306(serial, framebuffer=diff_to_previous())
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((5, 0), fill="white")
+        draw.point((3, 8), fill="white")
+        draw.point((100, 63), fill="white")
+
+    assert serial.mock_calls == [
+        call.command(33, 3, 5, 34, 0, 1),
+        call.data([0, 0, 0x01, 0x01, 0, 0]),
+        call.command(33, 100, 100, 34, 7, 7),
+        call.data([0x80])]
+
+    # A frame that packs to the same pages sends nothing
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((5, 0), fill="white")
+        draw.point((3, 8), fill="white")
+        draw.point((100, 63), fill="white")
+    assert serial.mock_calls == []
+
+
+def test_scroll():
+    """
+    SSD1306 OLED scrolls in hardware with nothing further sent, until the
+    scroll is stopped and the last frame is written back.
+    """
+    device = ssd1306(serial, framebuffer=diff_to_previous())
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    serial.reset_mock()
+    device.start_scroll("right", start_page=1, end_page=3, frames=25)
+    assert serial.mock_calls == [
+        call.command(0x26, 0x00, 1, 6, 3, 0x00, 0xFF),
+        call.command(0x2F)]
+
+    serial.reset_mock()
+    device.set_vertical_scroll_area(0, 64)
+    device.start_scroll(vertical_offset=1)
+    assert serial.mock_calls == [
+        call.command(0xA3, 0, 64),
+        call.command(0x2E),
+        call.command(0x2A, 0x00, 0, 7, 7, 1),
+        call.command(0x2F)]
+
+    serial.reset_mock()
+    device.stop_scroll()
+    assert serial.mock_calls == [
+        call.command(0x2E),
+        call.command(33, 0, 127, 34, 0, 7),
+        call.data([1] + [0] * 1023)]
+
+
+def test_scroll_then_display():
+    """
+    Displaying a frame while scrolling stops the scroll, and sends the whole
+    frame, as display memory has moved on since the last one.
+    """
+    device = ssd1306(serial, framebuffer=diff_to_previous())
+    device.start_scroll()
+
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    assert serial.mock_calls == [
+        call.command(0x2E),
+        call.command(33, 0, 127, 34, 0, 7),
+        call.data([1] + [0] * 1023)]
+
+
+def test_scroll_buffer():
+    """
+    SSD1306 OLED shows a frame that has moved up by rewriting only the newly
+    exposed rows, then moving the display start line.
+    """
+    device = ssd1306(serial, framebuffer=diff_to_previous(), scroll_buffer=True)
+
+    # Every row is different, then moves up by eight with a new row of text
+    first = Image.new("1", device.size)
+    for y in range(64):
+        first.putpixel((y, y), 1)
+    second = Image.new("1", device.size)
+    second.paste(first.crop((0, 8, 128, 64)))
+    for y in range(56, 64):
+        second.putpixel((100, y), 1)
+
+    device.display(first)
+    serial.reset_mock()
+    device.display(second)
+
+    # The new rows go where the top eight rows were, in page 0
+    expected = [0] * 101
+    expected[100] = 0xFF
+    assert serial.mock_calls == [
+        call.command(33, 0, 100, 34, 0, 0),
+        call.data(expected),
+        call.command(0x48)]
+
+    serial.reset_mock()
+    device.display(second)
+    assert serial.mock_calls == []
+
+
+def test_hardware_rotate_diff_to_previous():
+    """
+    SSD1306 OLED maps changed areas onto the rotated display memory when
+    rotating in the page encoder.
+    """
+    device = ssd1306(serial, width=64, height=48, rotate=3, hardware_rotate=True,
+                     framebuffer=diff_to_previous(num_segments=1))
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((20, 10), fill="white")
+
+    # Rotated 270°, the point is in column 10 and row 47 - 20 = 27 (page 3)
+    serial.command.assert_called_once_with(33, 42, 42, 34, 3, 3)
+    serial.data.assert_called_once_with([0x08])
@@ -81,3 +81,23 @@ def test_display():
 
     # Next 1024 bytes are data representing the drawn image
     serial.data.assert_called_once_with(get_reference_data('demo_ssd1309'))
+
+
+def test_scroll():
+    """
+    SSD1309 OLED sets the range of columns to scroll horizontally.
+    """
+    device = ssd1309(serial)
+    serial.reset_mock()
+
+    device.start_scroll()
+    assert serial.mock_calls == [
+        call.command(0x27, 0x00, 0, 7, 7, 0x00, 0x00, 0x7F),
+        call.command(0x2F)]
+
+    serial.reset_mock()
+    device.start_scroll("right", start_page=2, end_page=5, frames=3, vertical_offset=1)
+    assert serial.mock_calls == [
+        call.command(0x2E),
+        call.command(0x29, 0x01, 2, 4, 5, 1, 0x00, 0x7F),
+        call.command(0x2F)]
@@ -5,6 +5,7 @@
 
 from luma.oled.device import ssd1322
 from luma.core.render import canvas
+from PIL import Image
 from luma.core.framebuffer import full_frame
 
 from baseline_data import get_reference_data, primitives
@@ -151,3 +152,47 @@ def test_monochrome_display():
     # save_reference_data("demo_ssd1322_monochrome", recordings)
 
     assert recordings == get_reference_data('demo_ssd1322_monochrome')
+
+
+def test_greyscale_packing():
+    """
+    Each RGB pixel is reduced to a 4-bit luma value, and pairs of pixels are
+    packed into a byte with the left pixel in the high nibble.
+    """
+    device = ssd1322(serial, mode="RGB", framebuffer=full_frame())
+    serial.reset_mock()
+
+    pixels = [((i * 7) & 0xFF, (i * 13) & 0xFF, (i * 29) & 0xFF)
+              for i in range(device.width * device.height)]
+    img = Image.new("RGB", device.size)
+    img.putdata(pixels)
+    device.display(img)
+
+    grey = [(r * 306 + g * 601 + b * 117) >> 14 for r, g, b in pixels]
+    expected = [grey[i + 0] << 4 | grey[i + 1] for i in range(0, len(grey), 2)]
+
+    assert serial.data.call_args.args[0] == expected
+
+
+def test_greyscale_mode_l():
+    """
+    SSD1322 OLED accepts 8-bit greyscale images, quantizing each pixel to
+    4 bits exactly as it would the equivalent grey RGB pixel.
+    """
+    pixels = [(i * 5) & 0xFF for i in range(256 * 64)]
+
+    device = ssd1322(serial, mode="L", framebuffer=full_frame())
+    assert device.mode == "L"
+    serial.reset_mock()
+
+    img = Image.new("L", device.size)
+    img.putdata(pixels)
+    device.display(img)
+    expected = [pixels[i] & 0xF0 | pixels[i + 1] >> 4 for i in range(0, len(pixels), 2)]
+    assert serial.data.call_args.args[0] == expected
+
+    device = ssd1322(serial, mode="RGB", framebuffer=full_frame())
+    serial.reset_mock()
+
+    device.display(img.convert("RGB"))
+    assert serial.data.call_args.args[0] == expected
@@ -5,6 +5,7 @@
 
 from luma.oled.device import ssd1322_nhd
 from luma.core.render import canvas
+from PIL import Image
 from luma.core.framebuffer import full_frame
 
 from baseline_data import get_reference_data, primitives
@@ -139,3 +140,19 @@ def test_monochrome_display():
     # save_reference_data("demo_ssd1322_nhd_monochrome", recordings)
 
     assert recordings == get_reference_data('demo_ssd1322_nhd_monochrome')
+
+
+def test_greyscale_mode_l():
+    """
+    SSD1322_NHD OLED accepts 8-bit greyscale images, repeating the 4-bit
+    value of each pixel in both nibbles.
+    """
+    device = ssd1322_nhd(serial, mode="L")
+    serial.reset_mock()
+
+    img = Image.new("L", device.size)
+    img.putdata([i & 0xFF for i in range(128 * 64)])
+    device.display(img)
+
+    expected = [(i & 0xFF) >> 4 for i in range(128 * 64)]
+    assert serial.data.call_args.args[0] == [v << 4 | v for v in expected]
@@ -5,6 +5,7 @@
 
 from luma.oled.device import ssd1327
 from luma.core.render import canvas
+from PIL import Image
 from luma.core.framebuffer import diff_to_previous, full_frame
 
 from baseline_data import get_reference_data, primitives
@@ -110,3 +111,62 @@ def test_framebuffer_override():
     Reproduce https://github.com/rm-hull/luma.examples/issues/95
     """
     ssd1327(serial, mode="1", framebuffer=diff_to_previous())
+
+
+def test_greyscale_packing():
+    """
+    Each RGB pixel is reduced to a 4-bit luma value, and pairs of pixels are
+    packed into a byte with the right pixel in the high nibble.
+    """
+    device = ssd1327(serial, mode="RGB", framebuffer=full_frame())
+    serial.reset_mock()
+
+    pixels = [((i * 7) & 0xFF, (i * 13) & 0xFF, (i * 29) & 0xFF)
+              for i in range(device.width * device.height)]
+    img = Image.new("RGB", device.size)
+    img.putdata(pixels)
+    device.display(img)
+
+    grey = [(r * 306 + g * 601 + b * 117) >> 14 for r, g, b in pixels]
+    expected = [grey[i + 1] << 4 | grey[i + 0] for i in range(0, len(grey), 2)]
+
+    assert serial.data.call_args.args[0] == expected
+
+
+def test_damage_plan():
+    """
+    SSD1327 OLED plans its windows on whole bytes of packed pixels.
+    """
+    device = ssd1327(serial, framebuffer=diff_to_previous(num_segments=16))
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 31), fill="white")
+        draw.point((5, 32), fill="white")
+
+    assert device.damage_plan.windows == [(0, 31, 8, 33)]
+    serial.command.assert_called_once_with(21, 0, 3, 117, 31, 32)
+
+
+def test_scroll_buffer():
+    """
+    SSD1327 OLED moves the display start line to show a frame that has moved
+    up, rewriting only the newly exposed row.
+    """
+    device = ssd1327(serial, framebuffer=diff_to_previous(), scroll_buffer=True)
+
+    first = Image.new("RGB", device.size)
+    for y in range(128):
+        first.putpixel((y, y), (255, 255, 255))
+    second = Image.new("RGB", device.size)
+    second.paste(first.crop((0, 1, 128, 128)))
+    second.putpixel((5, 127), (255, 255, 255))
+
+    device.display(first)
+    serial.reset_mock()
+    device.display(second)
+
+    assert serial.mock_calls == [
+        call.command(21, 0, 3, 117, 0, 0),
+        call.data([0x00, 0x00, 0xF0, 0x00]),
+        call.command(0xA1, 1)]
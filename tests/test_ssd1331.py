@@ -6,8 +6,11 @@
 import pytest
 
 from luma.oled.device import ssd1331
+from luma.oled.device.hardware_draw import accelerated_canvas
+from luma.oled.device.encoder import rgb565
 from luma.core.render import canvas
-from luma.core.framebuffer import full_frame
+from luma.core.framebuffer import full_frame, diff_to_previous
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
 from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
@@ -45,6 +48,15 @@ def test_init_invalid_dimensions():
     assert_invalid_dimensions(ssd1331, serial, 23, 57)
 
 
+@pytest.mark.parametrize('batch', [False, True])
+def test_attach_without_initialize(batch):
+    """
+    Attaching to a running SSD1331 without initializing it sends nothing.
+    """
+    ssd1331(serial, batch=batch, attach=True, initialize=False)
+    assert serial.mock_calls == []
+
+
 def test_hide():
     """
     SSD1331 OLED screen content can be hidden.
@@ -114,3 +126,253 @@ def test_16bit_rgb_packing(bit, expected_16_bit_color):
         draw.rectangle(device.bounding_box, outline=rgb_color, fill=rgb_color)
 
     serial.data.assert_called_once_with(expected)
+
+
+def test_16bit_rgb_packing_mixed_channels():
+    """
+    Checks that each channel is packed independently of the others, when
+    every pixel has a different colour.
+    """
+    device = ssd1331(serial, framebuffer=full_frame())
+    serial.reset_mock()
+
+    img = Image.new("RGB", device.size)
+    img.putdata([((i * 7) & 0xFF, (i * 13) & 0xFF, (i * 29) & 0xFF)
+                 for i in range(device.width * device.height)])
+    device.display(img)
+
+    expected = []
+    for y in range(device.height):
+        for x in range(device.width):
+            r, g, b = img.getpixel((x, y))
+            expected += [r & 0xF8 | g >> 5, g << 3 & 0xE0 | b >> 3]
+
+    serial.data.assert_called_once_with(expected)
+
+
+def test_display_palette_image():
+    """
+    A palette ("P" mode) image is packed the same as its RGB equivalent.
+    """
+    device = ssd1331(serial, framebuffer=full_frame())
+
+    img = Image.new("RGB", device.size)
+    img.putdata([((i * 7) & 0xFF, (i * 13) & 0xFF, (i * 29) & 0xFF)
+                 for i in range(device.width * device.height)])
+    img = img.quantize(colors=256)
+
+    serial.reset_mock()
+    device.display(img.convert("RGB"))
+    expected = serial.data.call_args
+
+    serial.reset_mock()
+    device.display(img)
+    assert serial.data.call_args == expected
+
+
+@pytest.mark.parametrize("rotate,remap", [(1, 0x71), (2, 0x60), (3, 0x63)])
+def test_hardware_rotate(rotate, remap):
+    """
+    SSD1331 OLED with ``hardware_rotate=True`` sets up the remap for the
+    rotation, and sends the image unrotated into a transposed window when
+    using vertical address increment.
+    """
+    device = ssd1331(serial, rotate=rotate, hardware_rotate=True, framebuffer=full_frame())
+    assert serial.command.mock_calls[0].args[1:3] == (0xA0, remap)
+    serial.reset_mock()
+
+    pixels = [((i * 7) & 0xFF, (i * 13) & 0xFF, (i * 29) & 0xFF)
+              for i in range(device.width * device.height)]
+    img = Image.new("RGB", device.size)
+    img.putdata(pixels)
+    device.display(img)
+
+    # Transposed or not, the window covers all 96 columns and 64 rows
+    serial.command.assert_called_once_with(0x15, 0, 95, 0x75, 0, 63)
+
+    expected = []
+    for r, g, b in pixels:
+        expected += [r & 0xF8 | g >> 5, g << 3 & 0xE0 | b >> 3]
+    serial.data.assert_called_once_with(expected)
+
+
+def test_hardware_rotate_damage_plan():
+    """
+    SSD1331 OLED rotated 90° in hardware plans windows in the rotated frame,
+    so falling back to the whole frame still covers display memory exactly.
+    """
+    device = ssd1331(serial, rotate=1, hardware_rotate=True)
+    assert device.size == (64, 96)
+
+    # Four blocks around a small hole: no two are cheaper sent together,
+    # but the whole frame is cheaper than all four
+    plan = device.damage_planner.plan([
+        (0, 0, 34, 50), (34, 0, 64, 54), (30, 54, 64, 96), (0, 50, 30, 96)])
+    assert plan.windows == [(0, 0, 64, 96)]
+
+    serial.reset_mock()
+    device._write_window(rgb565(Image.new("RGB", device.size)), plan.windows[0])
+    serial.command.assert_called_once_with(0x15, 0, 95, 0x75, 0, 63)
+    assert len(serial.data.call_args[0][0]) == 96 * 64 * 2
+
+
+def test_damage_plan():
+    """
+    SSD1331 OLED merges changed areas into one window where that costs less
+    to send than separate windows, and exposes the plan it chose.
+    """
+    device = ssd1331(serial, framebuffer=diff_to_previous(num_segments=16))
+
+    # Adjacent points in two segments are sent as one window
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((10, 15), fill="white")
+        draw.point((10, 16), fill="white")
+
+    assert device.damage_plan.windows == [(10, 15, 11, 17)]
+    assert device.damage_plan.cost < device.damage_plan.unplanned_cost
+    serial.command.assert_called_once_with(21, 10, 10, 117, 15, 16)
+    serial.data.assert_called_once_with([0xFF] * 4)
+
+    # Opposite corners are cheaper to send separately
+    device = ssd1331(serial, framebuffer=diff_to_previous(num_segments=16))
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+        draw.point((95, 63), fill="white")
+
+    assert device.damage_plan.windows == [(0, 0, 1, 1), (95, 63, 96, 64)]
+    assert device.damage_plan.cost == device.damage_plan.unplanned_cost
+    assert len(serial.command.mock_calls) == 2
+
+
+def test_accelerated_canvas():
+    """
+    SSD1331 OLED draws rectangles and straight lines with its graphics
+    acceleration commands, sending pixels only for everything else.
+    """
+    device = ssd1331(serial, framebuffer=diff_to_previous(num_segments=16))
+
+    def draw_frame():
+        with accelerated_canvas(device) as draw:
+            draw.rectangle((10, 10, 49, 29), outline="red", fill="blue")
+            draw.line((0, 63, 95, 63), fill="white")
+            draw.text((60, 0), "A", fill="white")
+
+    serial.reset_mock()
+    draw_frame()
+
+    assert serial.command.mock_calls[:3] == [
+        call(0x26, 1),
+        call(0x22, 10, 10, 49, 29, 62, 0, 0, 0, 0, 62),
+        call(0x21, 0, 63, 95, 63, 62, 63, 62)]
+    assert device.damage_plan.windows
+    for left, top, right, bottom in device.damage_plan.windows:
+        assert left >= 60 and bottom <= 16
+
+    # Nothing has changed, so nothing is sent
+    serial.reset_mock()
+    draw_frame()
+    assert serial.mock_calls == []
+
+    # Clearing part of the rectangle is drawn by the display too
+    serial.reset_mock()
+    with accelerated_canvas(device) as draw:
+        draw.rectangle((10, 10, 49, 29), outline="red", fill="blue")
+        draw.line((0, 63, 95, 63), fill="white")
+        draw.text((60, 0), "A", fill="white")
+        draw.clear((20, 15, 29, 24))
+    assert serial.mock_calls == [call.command(0x25, 20, 15, 29, 24)]
+
+
+def test_accelerated_canvas_full_frame():
+    """
+    SSD1331 OLED sends the pixels of an accelerated canvas when the
+    framebuffer does not keep the previous frame.
+    """
+    device = ssd1331(serial, framebuffer=full_frame())
+    serial.reset_mock()
+
+    with accelerated_canvas(device) as draw:
+        draw.rectangle((10, 10, 49, 29), outline="red", fill="blue")
+
+    serial.command.assert_called_once_with(21, 0, 95, 117, 0, 63)
+    assert len(serial.data.call_args[0][0]) == 96 * 64 * 2
+
+
+def test_motion_search():
+    """
+    SSD1331 OLED moves content that has moved since the last frame with a
+    hardware copy, and sends only what the copy left different.
+    """
+    device = ssd1331(serial, framebuffer=diff_to_previous(num_segments=16),
+                     motion_search=8)
+
+    sprite = Image.new("RGB", (10, 10))
+    for y in range(10):
+        for x in range(10):
+            sprite.putpixel((x, y), (x * 25, y * 25, 100))
+
+    def frame(x, y):
+        image = Image.new("RGB", device.size)
+        image.paste(sprite, (x, y))
+        return image
+
+    device.display(frame(20, 20))
+    serial.reset_mock()
+
+    # Moving right copies the sprite and the background with it, in strips
+    # that do not overlap their source, starting from the right hand end
+    device.display(frame(24, 20))
+    assert serial.mock_calls == [
+        call.command(0x23, 26, 20, 29, 29, 30, 20),
+        call.command(0x23, 22, 20, 25, 29, 26, 20),
+        call.command(0x23, 18, 20, 21, 29, 22, 20),
+        call.command(0x23, 16, 20, 17, 29, 20, 20)]
+    assert device.copy_plan.source == (16, 20, 30, 30)
+    assert device.copy_plan.destination == (20, 20, 34, 30)
+    assert device.copy_plan.saving > 0
+    assert device.damage_plan.windows == []
+
+    # Moving up with a changed pixel sends that pixel after the copies
+    serial.reset_mock()
+    image = frame(24, 14)
+    image.putpixel((30, 18), (255, 255, 255))
+    device.display(image)
+    assert serial.mock_calls == [
+        call.command(0x23, 24, 20, 33, 25, 24, 14),
+        call.command(0x23, 24, 26, 33, 31, 24, 20),
+        call.command(0x23, 24, 32, 33, 35, 24, 26),
+        call.command(21, 30, 30, 117, 18, 18),
+        call.data([0xFF, 0xFF])]
+
+    # No change, nothing sent
+    serial.reset_mock()
+    device.display(image)
+    assert serial.mock_calls == []
+    assert device.copy_plan is None
+
+
+def test_accelerated_canvas_one_row_rectangle():
+    """
+    SSD1331 OLED draws a one row rectangle outline as a line, and sends as
+    pixels whatever ImageDraw drew beyond it, so the display matches.
+    """
+    device = ssd1331(serial, framebuffer=diff_to_previous(num_segments=16))
+    serial.reset_mock()
+
+    with accelerated_canvas(device) as draw:
+        draw.rectangle((26, 27, 80, 27), outline="white")
+
+    assert serial.command.mock_calls[0] == call(0x21, 26, 27, 80, 27, 62, 63, 62)
+    assert 0x22 not in [c.args[0] for c in serial.command.mock_calls]
+
+    # ImageDraw also drew the ends of the row below, which are sent as pixels
+    for x, y in ((26, 28), (80, 28)):
+        assert any(left <= x < right and top <= y < bottom
+                   for left, top, right, bottom in device.damage_plan.windows)
+
+    serial.reset_mock()
+    with accelerated_canvas(device) as draw:
+        draw.rectangle((26, 27, 80, 27), outline="white")
+    assert serial.mock_calls == []
@@ -7,10 +7,12 @@ import pytest
 
 from luma.oled.device import ssd1351
 from luma.core.render import canvas
-from luma.core.framebuffer import full_frame
+from luma.core.framebuffer import full_frame, diff_to_previous
+from PIL import Image
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
+from helpers import serial, assert_invalid_dimensions, setup_function, wire_format  # noqa: F401
+from unittest.mock import call
 
 
 def test_init_128x128():
@@ -258,3 +260,185 @@ def test_16bit_rgb_packing(bit, expected_16_bit_color):
         {'command': [117]}, {'data': [0, 127]},
         {'command': [92]}, {'data': expected}
     ]
+
+
+def test_batch():
+    """
+    SSD1351 OLED with ``batch=True`` sends exactly the same DC-framed bytes,
+    in fewer serial transactions.
+    """
+    def record(**kwargs):
+        recordings = []
+        serial.command.side_effect = lambda *cmd: recordings.append({'command': list(cmd)})
+        serial.data.side_effect = lambda data: recordings.append({'data': list(data)})
+
+        device = ssd1351(serial, framebuffer=full_frame(), **kwargs)
+        init = recordings[:]
+        recordings.clear()
+
+        with canvas(device) as draw:
+            primitives(device, draw)
+
+        return init, recordings
+
+    init, display = record()
+    batched_init, batched_display = record(batch=True)
+
+    assert wire_format(batched_init) == wire_format(init)
+    assert len(batched_init) < len(init)
+    assert wire_format(batched_display) == wire_format(get_reference_data('demo_ssd1351'))
+
+
+def test_display_rgb565():
+    """
+    Pre-packed RGB565 data is sent as-is, and is diffed against frames
+    rendered from images.
+    """
+    device = ssd1351(serial, width=96, height=96,
+                     framebuffer=diff_to_previous(num_segments=1))
+
+    img = Image.new("RGB", device.size)
+    img.putpixel((10, 20), (0xFF, 0x80, 0x08))
+    device.display(img)
+
+    data = bytearray(device.width * device.height * 2)
+    offset = (20 * device.width + 10) * 2
+    data[offset:offset + 2] = [0xFC, 0x01]
+
+    # Identical to the image already on the display
+    serial.reset_mock()
+    device.display_rgb565(data)
+    serial.command.assert_not_called()
+    serial.data.assert_not_called()
+
+    data[offset + 2:offset + 4] = [0x12, 0x34]
+    device.display_rgb565(bytes(data))
+    assert serial.command.mock_calls == [call(21), call(117), call(92)]
+    assert serial.data.mock_calls == [call([11, 11]), call([20, 20]), call([0x12, 0x34])]
+
+
+@pytest.mark.parametrize("rotate", [1, 2, 3])
+def test_hardware_rotate(rotate):
+    """
+    SSD1351 OLED with ``hardware_rotate=True`` remaps the display memory so
+    that an unrotated image appears the same as when rotating in software.
+    """
+    state = {'ram': {}}
+
+    def command(cmd):
+        state['cmd'], state['args'] = cmd, []
+
+    def data(values):
+        if state['cmd'] != 0x5C:
+            state['args'] += values
+            state[state['cmd']] = state['args']
+            return
+
+        # Write RAM, following the column/row window and address increment
+        (col_start, col_end), (row_start, row_end) = state[0x15], state[0x75]
+        cols = range(col_start, col_end + 1)
+        rows = range(row_start, row_end + 1)
+        if state[0xA0][0] & 0x01:
+            addresses = [(c, r) for c in cols for r in rows]
+        else:
+            addresses = [(c, r) for r in rows for c in cols]
+        for address, pixel in zip(addresses, zip(values[0::2], values[1::2])):
+            state['ram'][address] = pixel
+
+    serial.command.side_effect = command
+    serial.data.side_effect = data
+
+    device = ssd1351(serial, rotate=rotate, hardware_rotate=True)
+    img = Image.new("RGB", device.size)
+    img.putdata([((i * 7) & 0xFF, (i * 13) & 0xFF, (i * 29) & 0xFF)
+                 for i in range(device.width * device.height)])
+    device.display(img)
+
+    # Relative to the default remap (0x70), the column address remap flips
+    # the image horizontally and the COM scan direction vertically
+    remap = state[0xA0][0]
+    flip_x, flip_y = remap & 0x02, not remap & 0x10
+    expected = img.rotate(rotate * -90, expand=True)
+    for (c, r), pixel in state['ram'].items():
+        x = 127 - c if flip_x else c
+        y = 127 - r if flip_y else r
+        red, green, blue = expected.getpixel((x, y))
+        assert pixel == (red & 0xF8 | green >> 5, green << 3 & 0xE0 | blue >> 3)
+    assert len(state['ram']) == 128 * 128
+
+
+def test_hardware_rotate_offset_panel():
+    """
+    SSD1351 OLED panels that do not fill the display memory are still
+    rotated in software.
+    """
+    device = ssd1351(serial, width=128, height=96, rotate=1, hardware_rotate=True)
+    serial.data.assert_any_call([0x70])
+    serial.reset_mock()
+
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+
+    serial.data.assert_any_call([127, 127])
+
+
+def test_attach_frame_store(tmp_path):
+    """
+    Frames are kept as RGB565, whichever way they were displayed, and picked
+    up again when attaching.
+    """
+    device = ssd1351(serial, rotate=1, framebuffer=diff_to_previous(num_segments=1),
+                     frame_store=str(tmp_path))
+    with canvas(device) as draw:
+        draw.rectangle((10, 10, 20, 20), fill="red")
+
+    serial.reset_mock()
+    device = ssd1351(serial, rotate=1, framebuffer=diff_to_previous(num_segments=1),
+                     frame_store=str(tmp_path), attach=True, initialize=False)
+    assert serial.mock_calls == []
+
+    with canvas(device) as draw:
+        draw.rectangle((10, 10, 20, 20), fill="red")
+        draw.point((0, 0), fill="blue")
+    serial.data.assert_called_with([0x00, 0x1F])
+    assert len(serial.data.mock_calls) == 3
+
+
+def test_scroll():
+    """
+    SSD1351 OLED scrolls a range of rows in hardware, sending only changes
+    to the other rows until the scroll is stopped and the scrolled rows are
+    written back.
+    """
+    device = ssd1351(serial, framebuffer=full_frame())
+
+    serial.reset_mock()
+    device.start_scroll("left", start_row=32, rows=64, offset=2, speed="slow")
+    assert serial.mock_calls == [
+        call.command(0x96),
+        call.data([0xFE, 32, 64, 0x00, 2]),
+        call.command(0x9F)]
+
+    serial.reset_mock()
+    with canvas(device) as draw:
+        draw.point((0, 0), fill="white")
+        draw.point((0, 50), fill="white")
+
+    assert device.damage_plan.windows == [(0, 0, 128, 32), (0, 96, 128, 128)]
+    assert call.data([0, 31]) in serial.mock_calls
+    assert call.data([96, 127]) in serial.mock_calls
+
+    serial.reset_mock()
+    device.stop_scroll()
+    expected = [0] * 128 * 64 * 2
+    expected[18 * 128 * 2:18 * 128 * 2 + 2] = [0xFF, 0xFF]
+    assert serial.mock_calls == [
+        call.command(0x9E),
+        call.command(0x15), call.data([0, 127]),
+        call.command(0x75), call.data([32, 95]),
+        call.command(0x5C), call.data(expected)]
+
+    # Back to normal
+    serial.reset_mock()
+    device.display(Image.new("RGB", device.size))
+    assert device.damage_plan.windows == [(0, 0, 128, 128)]
@@ -8,7 +8,7 @@ from luma.core.render import canvas
 from luma.core.framebuffer import full_frame
 
 from baseline_data import get_reference_data, primitives
-from helpers import serial, assert_invalid_dimensions, setup_function  # noqa: F401
+from helpers import serial, assert_invalid_dimensions, setup_function, wire_format  # noqa: F401
 from unittest.mock import call
 
 
@@ -156,3 +156,27 @@ def test_monochrome_display():
     # save_reference_data("demo_ssd1363_monochrome", serial.data.call_args.args[0])
 
     assert serial.data.call_args == call(get_reference_data('demo_ssd1363_monochrome'))
+
+
+def test_batch():
+    """
+    SSD1363 OLED with ``batch=True`` keeps every parameter byte at DC-HIGH
+    and sends the same bytes as without batching, in fewer transactions.
+    """
+    def record(**kwargs):
+        recordings = []
+        serial.command.side_effect = lambda *cmd: recordings.append({'command': list(cmd)})
+        serial.data.side_effect = lambda data: recordings.append({'data': list(data)})
+
+        device = ssd1363(serial, mode="RGB", framebuffer=full_frame(), **kwargs)
+        with canvas(device) as draw:
+            primitives(device, draw)
+
+        return recordings
+
+    recordings = record()
+    batched_recordings = record(batch=True)
+
+    assert wire_format(batched_recordings) == wire_format(recordings)
+    assert len(batched_recordings) < len(recordings)
+    assert batched_recordings[-1] == {'data': get_reference_data('demo_ssd1363_greyscale')}
@@ -7,7 +7,7 @@
 Tests for the :py:class:`luma.oled.device.ws0010` device.
 """
 
-from luma.core.framebuffer import full_frame
+from luma.core.framebuffer import full_frame, diff_to_previous
 from luma.oled.device import ws0010, winstar_weh
 from luma.core.render import canvas
 from luma.core.util import bytes_to_nibbles
@@ -103,6 +103,177 @@ def test_display():
     interface.assert_has_calls(line1 + line2)
 
 
+def test_display_page_packing():
+    interface._bitmode = 8
+    d = ws0010(interface, framebuffer=full_frame())
+    interface.reset_mock()
+
+    img = Image.new('1', d.size)
+    img.putdata([(x * 7 + y * 3) % 5 == 0 for y in range(d.height) for x in range(d.width)])
+    d.display(img)
+
+    expected = [[0] * d.width for _ in range(d.height // 8)]
+    for y in range(d.height):
+        for x in range(d.width):
+            if img.getpixel((x, y)):
+                expected[y // 8][x] |= 1 << (y % 8)
+
+    interface.assert_has_calls([
+        call.command(DDRAMADDR, CGRAMADDR), call.data(bytearray(expected[0])),
+        call.command(DDRAMADDR, CGRAMADDR + 1), call.data(bytearray(expected[1]))])
+
+
+def test_character_mode():
+    interface._bitmode = 8
+    d = winstar_weh(interface, character_mode=True)
+
+    # Switch to character mode with font table FT00, and clear both lines
+    interface.assert_has_calls([
+        call.command((FUNCTIONSET | DL8) & ~0x03, POWERON | CHAR),
+        call.command(DDRAMADDR), call.data(b' ' * 16),
+        call.command(DDRAMADDR | 0x40), call.data(b' ' * 16)])
+
+    interface.reset_mock()
+    d.text = 'Hello\nWorld'
+    assert interface.mock_calls == [
+        call.command(DDRAMADDR), call.data(b'Hello'),
+        call.command(DDRAMADDR | 0x40), call.data(b'World')]
+
+    # Only the changed cells are rewritten
+    interface.reset_mock()
+    d.text = 'Help\nWorld'
+    assert interface.mock_calls == [call.command(DDRAMADDR | 3), call.data(b'p ')]
+
+
+def test_character_mode_graphics_fallback():
+    interface._bitmode = 8
+    d = winstar_weh(interface, character_mode=True)
+
+    # The FT01 glyph is not the one in the display's FT00 font table
+    d.font.combine(d.font.load('FT01'), 'é')
+
+    interface.reset_mock()
+    d.text = 'café'
+    assert interface.mock_calls[0] == call.command((FUNCTIONSET | DL8) & ~0x03, POWERON | GRAPHIC)
+    assert call.command(DDRAMADDR, CGRAMADDR) in interface.mock_calls
+
+    interface.reset_mock()
+    d.text = 'cafe'
+    assert interface.mock_calls == [
+        call.command((FUNCTIONSET | DL8) & ~0x03, POWERON | CHAR),
+        call.command(DDRAMADDR), call.data(b'cafe            '),
+        call.command(DDRAMADDR | 0x40), call.data(b' ' * 16)]
+
+
+def test_character_mode_custom_glyphs():
+    interface._bitmode = 8
+    d = winstar_weh(interface, character_mode=True)
+
+    glyphs = [chr(0xE000 + n) for n in range(9)]
+    for n, char in enumerate(glyphs):
+        img = Image.new('1', (5, 8))
+        img.putpixel((n % 5, n % 8), 1)
+        d.define_glyph(char, img)
+
+    interface.reset_mock()
+    d.text = ''.join(glyphs[:8])
+    assert interface.mock_calls[-4:] == [
+        call.command(CGRAMADDR | 7 << 3), call.data(b'\x00' * 7 + b'\x04'),
+        call.command(DDRAMADDR), call.data(bytes(range(8)))]
+
+    # The least recently used glyph not on show is evicted, and cells that
+    # still show the same CGRAM code are left alone
+    interface.reset_mock()
+    d.text = glyphs[8] + glyphs[1]
+    assert interface.mock_calls == [
+        call.command(CGRAMADDR), call.data(b'\x02' + b'\x00' * 7),
+        call.command(DDRAMADDR | 2), call.data(b' ' * 6)]
+
+    # Changing a glyph on show just re-uploads it
+    interface.reset_mock()
+    d.define_glyph(glyphs[1], Image.new('1', (5, 8), 1))
+    assert interface.mock_calls == [call.command(CGRAMADDR | 1 << 3), call.data(b'\x1f' * 8)]
+
+    # More glyphs than CGRAM slots are drawn in graphics mode
+    interface.reset_mock()
+    d.text = ''.join(glyphs)
+    assert interface.mock_calls[0] == call.command((FUNCTIONSET | DL8) & ~0x03, POWERON | GRAPHIC)
+
+
+def test_character_mode_custom_glyphs_unchanged():
+    interface._bitmode = 4
+    d = winstar_weh(interface, character_mode=True)
+    d.define_glyph('\ue000', Image.new('1', (5, 8), 1))
+    d.text = 'A\ue000'
+
+    # Showing the same glyph again sends nothing, not even a resync
+    interface.reset_mock()
+    d.text = 'A\ue000'
+    assert interface.mock_calls == []
+
+
+def test_define_glyph_over_image():
+    interface._bitmode = 8
+    d = ws0010(interface, framebuffer=diff_to_previous(num_segments=4))
+    with canvas(d) as drw:
+        drw.point((0, 0), fill='white')
+
+    # Defining a glyph leaves the image on show alone
+    interface.reset_mock()
+    d.define_glyph('\ue000', Image.new('1', (5, 8), 1))
+    assert interface.data.mock_calls == []
+
+
+def test_display_4bitmode_resync():
+    interface._bitmode = 4
+    d = ws0010(interface, framebuffer=diff_to_previous(num_segments=4))
+    interface.reset_mock()
+
+    # Two changed segments, but just one resync (and no reset) for the frame
+    with canvas(d) as drw:
+        drw.point((0, 0), fill='white')
+        drw.point((99, 15), fill='white')
+
+    resync = call.command(0, 0, 0, 0, 0, 2, 2, 9)
+    commands = [c for c in interface.mock_calls if c[0] == 'command']
+    assert commands == [
+        resync,
+        call.command(*bytes_to_nibbles([DDRAMADDR, CGRAMADDR])),
+        call.command(*bytes_to_nibbles([DDRAMADDR + 99, CGRAMADDR + 1]))]
+
+
+def test_attach():
+    interface._bitmode = 8
+    interface.reset_mock()
+    d = winstar_weh(interface, character_mode=True, attach=True, initialize=False)
+    assert interface.mock_calls == []
+
+    # The display could be in either mode, so it is set with the first text
+    d.text = 'Hi'
+    assert interface.mock_calls == [
+        call.command((FUNCTIONSET | DL8) & ~0x03, POWERON | CHAR),
+        call.command(DDRAMADDR), call.data(b'Hi' + b' ' * 14),
+        call.command(DDRAMADDR | 0x40), call.data(b' ' * 16)]
+
+
+def test_attach_after_text(tmp_path):
+    interface._bitmode = 8
+    d = winstar_weh(interface, character_mode=True, frame_store=str(tmp_path))
+    with canvas(d) as drw:
+        drw.point((0, 0), fill='white')
+    d.text = 'Hi'
+
+    # The image saved earlier is no longer on show, so is not picked up
+    interface.reset_mock()
+    d = winstar_weh(interface, character_mode=True, attach=True, initialize=False,
+                    frame_store=str(tmp_path))
+    with canvas(d) as drw:
+        drw.point((0, 0), fill='white')
+    assert interface.mock_calls[0] == call.command((FUNCTIONSET | DL8) & ~0x03, POWERON | GRAPHIC)
+    assert interface.data.mock_calls == [
+        call(b'\x01' + bytes(d.width - 1)), call(bytes(d.width))]
+
+
 def test_get_font():
     interface._bitmode = 8
     device = ws0010(interface, framebuffer=full_frame())
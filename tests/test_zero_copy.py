@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2026 Richard Hull and contributors
+# See LICENSE.rst for details.
+
+"""
+Tests (and a rough memory benchmark) for the opt-in ``zero_copy`` data path.
+"""
+
+import tracemalloc
+
+import pytest
+from PIL import Image, ImageDraw
+
+from luma.core.framebuffer import full_frame
+from luma.oled.device import ch1115, ssd1306, sh1106, sh1107, ssd1331, ssd1351, \
+    ssd1322, ssd1362, ssd1363, ssd1322_nhd
+
+from baseline_data import primitives
+
+
+class recording_serial(object):
+    """
+    Minimal serial interface that keeps the data bytes it was sent, and the
+    most memory that was held by the caller at the point of sending.
+    """
+    def __init__(self):
+        self.sent = bytearray()
+        self.held = 0
+
+    def command(self, *cmd):
+        pass
+
+    def data(self, data):
+        if tracemalloc.is_tracing():
+            self.held = max(self.held, tracemalloc.get_traced_memory()[0])
+        self.sent.extend(data)
+
+
+def render(device_type, zero_copy, **kwargs):
+    """
+    Displays the demo primitives, returning the bytes that were sent and the
+    memory allocated for the frame at the point it was handed over.
+    """
+    serial = recording_serial()
+    device = device_type(serial, framebuffer=full_frame(), zero_copy=zero_copy, **kwargs)
+    serial.sent.clear()
+
+    image = Image.new(device.mode, device.size)
+    primitives(device, ImageDraw.Draw(image))
+
+    tracemalloc.start()
+    device.display(image)
+    tracemalloc.stop()
+
+    return bytes(serial.sent), serial.held
+
+
+@pytest.mark.parametrize("device_type,kwargs", [
+    (ch1115, {}),
+    (ssd1306, {}),
+    (sh1106, {}),
+    (sh1107, {}),
+    (ssd1331, {}),
+    (ssd1351, {}),
+    (ssd1322, {"mode": "RGB"}),
+    (ssd1362, {"mode": "1"}),
+    (ssd1363, {"mode": "RGB"}),
+    (ssd1322_nhd, {"mode": "RGB"}),
+])
+def test_zero_copy(device_type, kwargs):
+    """
+    The ``zero_copy`` data path sends exactly the same bytes as the list
+    based path, but allocates less memory per frame.
+    """
+    expected, list_held = render(device_type, zero_copy=False, **kwargs)
+    actual, zero_copy_held = render(device_type, zero_copy=True, **kwargs)
+
+    assert actual == expected
+    assert zero_copy_held < list_held